@@ -5,7 +5,7 @@ import Slider from '@react-native-community/slider';
 import MaterialCommunityIcons from '@expo/vector-icons/MaterialCommunityIcons';
 import NumberStepper from '../components/NumberStepper';
 import BadgesModal from '../components/BadgesModal';
-import { getWeight, hasBaseWeight, getValidSliderBounds } from '../utils/getWeight';
+import { getWeight, hasBaseWeight, getValidSliderBounds, getPrevValidValue, findNearestValidValue } from '../utils/getWeight';
 import { WEIGHT_CAP } from '../config';
 import { SKILL_GROUPS, getSkillGroup } from '../data/skillGroups';
 import { checkPrimaryConstraints, checkDependentConstraints, resolveAllConstraints } from '../data/attributeConstraints';
@@ -134,19 +134,7 @@ export default function HomeScreen({ navigation, route }) {
     const preferHigher = rawNew > oldVal;
     let newVal = rawNew;
     if (!hasBaseWeight(heightInches, skill, newVal)) {
-      let found = null;
-      const LOW = 25, HIGH = 99;
-      for (let r = 0; r <= HIGH - LOW; r++) {
-        const candidates = preferHigher ? [newVal + r, newVal - r] : [newVal - r, newVal + r];
-        for (const c of candidates) {
-          if (c < LOW || c > HIGH) continue;
-          if (hasBaseWeight(heightInches, skill, c)) {
-            found = c;
-            break;
-          }
-        }
-        if (found != null) break;
-      }
+      const found = findNearestValidValue(heightInches, skill, newVal, preferHigher);
       if (found == null) {
         showCapError('No valid value available for this skill');
         return;
@@ -186,9 +174,7 @@ export default function HomeScreen({ navigation, route }) {
 
     // If increasing, try to clamp down to the highest allowed value between oldVal and newVal
     if (newVal > oldVal) {
-      for (let v = newVal; v > oldVal; v--) {
-        if (!hasBaseWeight(heightInches, skill, v)) continue;
-        
+      for (let v = getPrevValidValue(heightInches, skill, newVal); v != null && v > oldVal; v = getPrevValidValue(heightInches, skill, v - 1)) {
         // Resolve all cascading constraints for this clamped value
         const clampedResult = resolveAllConstraints(skill, v, values, heightInches);
         const clampedUpdates = clampedResult.updates;
@@ -218,20 +204,12 @@ export default function HomeScreen({ navigation, route }) {
 
   const handleHeightChange = useCallback((newHeight) => {
     // For each skill, ensure the current slider value is valid for the new height. If not, pick the nearest valid value.
-    const LOW = 25, HIGH = 99;
-
     const adjustedValues = { ...values };
     for (const skill of SKILLS) {
       const cur = adjustedValues[skill];
       if (!hasBaseWeight(newHeight, skill, cur)) {
-        // find nearest valid
-        let found = null;
-        for (let r = 0; r <= HIGH - LOW; r++) {
-          const candA = cur - r;
-          const candB = cur + r;
-          if (candA >= LOW && hasBaseWeight(newHeight, skill, candA)) { found = candA; break; }
-          if (candB <= HIGH && hasBaseWeight(newHeight, skill, candB)) { found = candB; break; }
-        }
+        // find nearest valid, lower value first on ties
+        const found = findNearestValidValue(newHeight, skill, cur);
         if (found == null) {
           showCapError(`No valid slider values for ${skill} at new height`);
           return;
@@ -462,22 +440,8 @@ export default function HomeScreen({ navigation, route }) {
               // compute whether moving exactly one step (+1) would push us over the cap
               let nextValidFromOneStep = null;
               const ONE_STEP = displayValue + 1;
-              const LOW = 25, HIGH = 99;
               if (bounds && ONE_STEP <= bounds.max) {
-                let rawNew = ONE_STEP;
-                if (hasBaseWeight(heightInches, skill, rawNew)) {
-                  nextValidFromOneStep = rawNew;
-                } else {
-                  for (let r = 0; r <= HIGH - LOW; r++) {
-                    const candidates = [rawNew + r, rawNew - r];
-                    let found = null;
-                    for (const c of candidates) {
-                      if (c < LOW || c > HIGH) continue;
-                      if (hasBaseWeight(heightInches, skill, c)) { found = c; break; }
-                    }
-                    if (found != null) { nextValidFromOneStep = found; break; }
-                  }
-                }
+                nextValidFromOneStep = findNearestValidValue(heightInches, skill, ONE_STEP, true);
                 if (nextValidFromOneStep != null && nextValidFromOneStep <= displayValue) {
                   nextValidFromOneStep = null;
                 }
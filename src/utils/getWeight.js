@@ -1,34 +1,52 @@
-const weightsByHeight = require('../data/build_weights.json');
+// Precomputed by tools/generate_weight_lookup.py from build_weights.json (npm run build:weights)
+const lookup = require('../data/build_weights_lookup.json');
 
-function findClosestHeight(h) {
-  const heights = Object.keys(weightsByHeight).map(Number).filter(Number.isFinite);
-  if (heights.includes(h)) return h;
-  let closest = heights[0];
-  let bestDiff = Math.abs(h - closest);
+const { skills, heights, minValue, numValues, heightMin, heightMax, heightIndex, cumulative, next, prev } = lookup;
+const maxValue = minValue + numValues - 1;
+
+const skillIndexCache = new Map(skills.map((s, i) => [s, i]));
+
+function findClosestRow(h) {
+  if (Number.isInteger(h)) {
+    return heightIndex[Math.min(Math.max(h, heightMin), heightMax) - heightMin];
+  }
+  // Non-integer heights: closest by scan, shorter height wins ties
+  let best = 0;
+  let bestDiff = Math.abs(h - heights[0]);
   for (let i = 1; i < heights.length; i++) {
     const diff = Math.abs(h - heights[i]);
     if (diff < bestDiff) {
       bestDiff = diff;
-      closest = heights[i];
+      best = i;
     }
   }
-  return closest;
+  return best;
 }
 
-// Case-insensitive skill key lookup
-function findSkillEntry(skillsObj, skillName) {
-  if (!skillsObj) return null;
-  if (Object.prototype.hasOwnProperty.call(skillsObj, skillName)) return skillName;
+function findClosestHeight(h) {
+  return heights[findClosestRow(h)];
+}
+
+// Case-insensitive skill index lookup, resolved once per name
+function findSkillIndex(skillName) {
+  const cached = skillIndexCache.get(skillName);
+  if (cached !== undefined) return cached;
   const lower = skillName.toLowerCase();
-  const keys = Object.keys(skillsObj);
-  for (const k of keys) {
-    if (k.toLowerCase() === lower) return k;
-  }
-  // try substring match
-  for (const k of keys) {
-    if (k.toLowerCase().includes(lower) || lower.includes(k.toLowerCase())) return k;
+  let idx = skills.findIndex((k) => k.toLowerCase() === lower);
+  if (idx === -1) {
+    // try substring match
+    idx = skills.findIndex((k) => k.toLowerCase().includes(lower) || lower.includes(k.toLowerCase()));
   }
-  return null;
+  const result = idx === -1 ? null : idx;
+  skillIndexCache.set(skillName, result);
+  return result;
+}
+
+// Offset of (height, skill, 25) in the flat lookup arrays, or -1
+function rowOffset(heightInches, skillName) {
+  const s = findSkillIndex(skillName);
+  if (s == null) return -1;
+  return (findClosestRow(Number(heightInches)) * skills.length + s) * numValues;
 }
 
 /**
@@ -38,51 +56,74 @@ function findSkillEntry(skillsObj, skillName) {
  */
 function getWeight(heightInches, skillName, sliderValue) {
   if (!heightInches || !skillName || !sliderValue) return null;
-  const h = findClosestHeight(Number(heightInches));
-  const skillKey = findSkillEntry(weightsByHeight[h], skillName);
-  if (!skillKey) return null;
-  const arr = weightsByHeight[h][skillKey];
-  const idx = Number(sliderValue) - 25;
-  if (!Array.isArray(arr) || idx < 0 || idx >= arr.length) return null;
-
-  // Simple cumulative sum from index 0 (value 25) up to idx
-  let total = 0;
-  for (let i = 0; i <= idx; i++) {
-    const val = arr[i];
-    if (val != null) {
-      total += Number(val);
-    }
-  }
-  return total;
+  const offset = rowOffset(heightInches, skillName);
+  const idx = Math.floor(Number(sliderValue) - minValue);
+  if (offset === -1 || !(idx >= 0 && idx < numValues)) return null;
+  return cumulative[offset + idx];
 }
 
 function hasBaseWeight(heightInches, skillName, sliderValue) {
   if (!heightInches || !skillName || !sliderValue) return false;
-  const h = findClosestHeight(Number(heightInches));
-  const skillKey = findSkillEntry(weightsByHeight[h], skillName);
-  if (!skillKey) return false;
-  const arr = weightsByHeight[h][skillKey];
-  const idx = Number(sliderValue) - 25;
-  return Array.isArray(arr) && idx >= 0 && idx < arr.length && arr[idx] != null;
+  const offset = rowOffset(heightInches, skillName);
+  const value = Number(sliderValue);
+  if (offset === -1 || !Number.isInteger(value) || value < minValue || value > maxValue) return false;
+  return next[offset + value - minValue] === value;
 }
 
 function getValidSliderBounds(heightInches, skillName) {
   if (!heightInches || !skillName) return null;
-  const h = findClosestHeight(Number(heightInches));
-  const skillKey = findSkillEntry(weightsByHeight[h], skillName);
-  if (!skillKey) return null;
-  const arr = weightsByHeight[h][skillKey];
-  if (!Array.isArray(arr)) return null;
-  let first = -1;
-  let last = -1;
-  for (let i = 0; i < arr.length; i++) {
-    if (arr[i] != null) {
-      if (first === -1) first = i;
-      last = i;
-    }
-  }
-  if (first === -1) return null;
-  return { min: 25 + first, max: 25 + last };
+  const offset = rowOffset(heightInches, skillName);
+  if (offset === -1) return null;
+  const min = next[offset];
+  if (!min) return null;
+  return { min, max: prev[offset + numValues - 1] };
+}
+
+/**
+ * Smallest valid slider value >= sliderValue (values below 25 start at 25), or null.
+ */
+function getNextValidValue(heightInches, skillName, sliderValue) {
+  if (!heightInches || !skillName) return null;
+  const offset = rowOffset(heightInches, skillName);
+  const value = Math.ceil(Math.max(Number(sliderValue), minValue));
+  if (offset === -1 || !(value <= maxValue)) return null;
+  return next[offset + value - minValue] || null;
+}
+
+/**
+ * Largest valid slider value <= sliderValue (values above 99 start at 99), or null.
+ */
+function getPrevValidValue(heightInches, skillName, sliderValue) {
+  if (!heightInches || !skillName) return null;
+  const offset = rowOffset(heightInches, skillName);
+  const value = Math.floor(Math.min(Number(sliderValue), maxValue));
+  if (offset === -1 || !(value >= minValue)) return null;
+  return prev[offset + value - minValue] || null;
+}
+
+/**
+ * Closest valid slider value to sliderValue, or null if the skill has none.
+ *
+ * On a tie the value above wins when preferHigher is set, otherwise the one below.
+ */
+function findNearestValidValue(heightInches, skillName, sliderValue, preferHigher = false) {
+  const value = Number(sliderValue);
+  const above = getNextValidValue(heightInches, skillName, value);
+  const below = getPrevValidValue(heightInches, skillName, value);
+  if (above == null) return below;
+  if (below == null) return above;
+  const diffAbove = above - value;
+  const diffBelow = value - below;
+  if (diffAbove === diffBelow) return preferHigher ? above : below;
+  return diffAbove < diffBelow ? above : below;
 }
 
-module.exports = { getWeight, findClosestHeight, hasBaseWeight, getValidSliderBounds };
+module.exports = {
+  getWeight,
+  findClosestHeight,
+  hasBaseWeight,
+  getValidSliderBounds,
+  getNextValidValue,
+  getPrevValidValue,
+  findNearestValidValue,
+};
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Badge prevalence per height across a build corpus.
+
+Evaluates every badge in src/data/badges.js for every build with the compiled
+badge tables in build_rules (one pass over the corpus, no per-build loop) and
+reports how often each badge is unlocked at each height.
+
+Usage:
+  python tools/badge_prevalence.py builds.csv [--overall 99] [--min-level 3] [--out prevalence.csv]
+  python tools/badge_prevalence.py builds.bld
+"""
+
+import argparse
+import csv
+import time
+from pathlib import Path
+
+import build_rules
+import weight_arrays
+from skill_schema import format_height
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+# build_records builds its record dtype at import time
+build_records = lazy_import('build_records')
+
+
+def load_heights_and_skills(path, overall=None):
+    """Heights and skills from a .bld archive, build CSV or .npz corpus."""
+    if Path(path).suffix == '.bld':
+        records, _ = build_records.read_archive(path)
+        builds = build_records.decode_records(records)
+    else:
+        builds = weight_arrays.load_corpus(path, overall=overall)
+    return builds['height'], builds['skills']
+
+
+def level_counts(levels, heights, max_level):
+    """
+    Builds per (height, badge, level), shape (H, B, max_level + 1), counted
+    with one bincount. Returns (unique heights, counts).
+    """
+    unique_heights, height_rows = np.unique(heights, return_inverse=True)
+    n_badges = levels.shape[1]
+    keys = (height_rows[:, None] * n_badges + np.arange(n_badges)) * (max_level + 1) + levels
+    counts = np.bincount(keys.ravel(), minlength=len(unique_heights) * n_badges * (max_level + 1))
+    return unique_heights, counts.reshape(len(unique_heights), n_badges, max_level + 1)
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Badge prevalence per height across a build corpus")
+    parser.add_argument('corpus', help='Build CSV, .npz corpus cache or .bld archive')
+    parser.add_argument('--overall', type=int, help='Only use builds with this overall rating')
+    parser.add_argument('--min-level', type=int, default=1, help='Count a badge from this level up (default: 1, Bronze)')
+    parser.add_argument('--out', help='Write builds per height, badge and level to this CSV')
+    args = parser.parse_args(argv)
+
+    print(f"Loading builds from {args.corpus}...")
+    heights, skills = load_heights_and_skills(args.corpus, overall=args.overall)
+    print(f"Loaded {len(heights):,} builds")
+    if not len(heights):
+        return
+
+    compiled = build_rules.compile_badges(build_rules.load_badges())
+    badges = compiled['definitions']
+    start = time.perf_counter()
+    levels = build_rules.evaluate_badges(compiled, heights, skills)
+    elapsed = time.perf_counter() - start
+    print(f"Evaluated {len(badges)} badges in {elapsed:.2f}s ({len(heights) / max(elapsed, 1e-9):,.0f} builds/s)")
+
+    max_level = int(compiled['level_values'].max())
+    unique_heights, counts = level_counts(levels, heights, max_level)
+    per_height = counts.sum(axis=2)
+    unlocked = counts[:, :, args.min_level:].sum(axis=2)
+    share = unlocked / per_height
+
+    print(f"\nBuilds with each badge at level {args.min_level}+ ({len(unique_heights)} heights):")
+    print("-" * 78)
+    print(f"{'Badge':<28} {'Overall':>8} {'Lowest height':>19} {'Highest height':>19}")
+    print("-" * 78)
+    overall_share = unlocked.sum(axis=0) / len(heights)
+    for bi in np.argsort(-overall_share):
+        lo, hi = share[:, bi].argmin(), share[:, bi].argmax()
+        print(f"{badges[bi]['name']:<28} {overall_share[bi]:>8.1%} "
+              f"{format_height(unique_heights[lo]):>7} {share[lo, bi]:>11.1%} "
+              f"{format_height(unique_heights[hi]):>7} {share[hi, bi]:>11.1%}")
+
+    if args.out:
+        labels = {}
+        for badge in badges:
+            for level in badge['levels']:
+                labels[(badge['id'], level['level'])] = level['label']
+        with open(args.out, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['height', 'badge', 'level', 'label', 'builds', 'fraction'])
+            for hi, height in enumerate(unique_heights):
+                for bi, badge in enumerate(badges):
+                    for level in range(max_level + 1):
+                        n = int(counts[hi, bi, level])
+                        if n:
+                            writer.writerow([int(height), badge['id'], level, labels.get((badge['id'], level), ''),
+                                             n, f"{n / per_height[hi, bi]:.4f}"])
+        print(f"\nWrote per-height level counts to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
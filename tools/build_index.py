@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Nearest-neighbour index over scraped builds, partitioned by height.
+
+Keeps the 99-OVR corpora used for weight fitting around so you can ask which
+real builds at a height are closest to a slider vector. Skill vectors are
+stored as uint8, grouped by height, and persisted to a single .npz. Queries use
+a scipy cKDTree per height (built lazily on first use), or a brute-force scan
+over the quantized arrays with --brute or when scipy is not installed.
+
+Usage:
+  python tools/build_index.py build builds.csv --out builds-index.npz [--overall 99]
+  python tools/build_index.py query builds-index.npz --height "6'8" --skills 60,65,...,55 -k 5
+  python tools/build_index.py query builds-index.npz --height 80 --skills ... --radius 40
+
+Without --skills, query reads "height v1 v2 ... v21" lines from stdin and
+answers each one, which makes for a quick interactive loop.
+"""
+
+import argparse
+import importlib.util
+import sys
+import time
+
+import weight_arrays
+from skill_schema import SKILLS, format_height
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+# KD-trees need scipy; without it queries fall back to the brute-force scan
+spatial = lazy_import('scipy.spatial') if importlib.util.find_spec('scipy') else None
+
+
+class BuildIndex:
+    """k-NN and radius queries over builds of one height at a time."""
+
+    def __init__(self, heights, offsets, skills, rows, overall, position, brute=False):
+        self.heights = heights
+        self.offsets = offsets
+        self.skills = skills
+        self.rows = rows
+        self.overall = overall
+        self.position = position
+        self.brute = brute or spatial is None
+        self._trees = {}
+        self._dense = {}
+
+    @classmethod
+    def from_corpus(cls, corpus, brute=False):
+        order = np.argsort(corpus['height'], kind='stable')
+        heights, counts = np.unique(corpus['height'][order], return_counts=True)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        return cls(
+            heights.astype(np.int16), offsets.astype(np.int64),
+            np.ascontiguousarray(corpus['skills'][order], dtype=np.uint8),
+            order.astype(np.int64), corpus['overall'][order], corpus['position'][order],
+            brute=brute,
+        )
+
+    @classmethod
+    def load(cls, path, brute=False):
+        with np.load(path) as data:
+            return cls(data['heights'], data['offsets'], data['skills'], data['rows'],
+                       data['overall'], data['position'], brute=brute)
+
+    def save(self, path):
+        np.savez(path, heights=self.heights, offsets=self.offsets, skills=self.skills,
+                 rows=self.rows, overall=self.overall, position=self.position)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def partition(self, height):
+        """Slice of the sorted arrays holding builds of this height, or None."""
+        i = np.searchsorted(self.heights, height)
+        if i == len(self.heights) or self.heights[i] != height:
+            return None
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def _tree(self, height, part):
+        tree = self._trees.get(height)
+        if tree is None:
+            tree = self._trees[height] = spatial.cKDTree(self.skills[part])
+        return tree
+
+    def _dense_part(self, height, part):
+        dense = self._dense.get(height)
+        if dense is None:
+            data = self.skills[part].astype(np.float32)
+            dense = self._dense[height] = (data, np.einsum('ij,ij->i', data, data))
+        return dense
+
+    def _brute_distances(self, height, part, query):
+        data, norms = self._dense_part(height, part)
+        q = np.asarray(query, dtype=np.float32)
+        d2 = norms - 2.0 * (data @ q) + q @ q
+        return np.sqrt(np.maximum(d2, 0.0))
+
+    def knn(self, height, query, k=5):
+        """(distances, positions) of the k closest builds, closest first."""
+        part = self.partition(height)
+        if part is None:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        k = min(k, part.stop - part.start)
+        if self.brute:
+            dist = self._brute_distances(height, part, query)
+            idx = np.argpartition(dist, k - 1)[:k]
+            idx = idx[np.argsort(dist[idx])]
+            return dist[idx], idx + part.start
+        dist, idx = self._tree(height, part).query(np.asarray(query, dtype=float), k=k)
+        return np.atleast_1d(dist), np.atleast_1d(idx) + part.start
+
+    def radius(self, height, query, r):
+        """(distances, positions) of all builds within Euclidean distance r, closest first."""
+        part = self.partition(height)
+        if part is None:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        if self.brute:
+            dist = self._brute_distances(height, part, query)
+            idx = np.flatnonzero(dist <= r)
+            dist = dist[idx]
+        else:
+            idx = np.array(self._tree(height, part).query_ball_point(np.asarray(query, dtype=float), r), dtype=np.int64)
+            diffs = self.skills[idx + part.start].astype(np.int32) - np.asarray(query)
+            dist = np.sqrt((diffs ** 2).sum(axis=1))
+        order = np.argsort(dist)
+        return dist[order], idx[order] + part.start
+
+
+def parse_skill_vector(text):
+    values = [int(v) for v in text.replace(',', ' ').split()]
+    if len(values) != len(SKILLS):
+        raise ValueError(f"Expected {len(SKILLS)} skill values, got {len(values)}")
+    return np.array(values)
+
+
+def print_matches(index, dist, pos, query):
+    if not len(pos):
+        print("  No builds found")
+        return
+    for d, p in zip(dist, pos):
+        diffs = index.skills[p].astype(int) - query
+        biggest = np.argsort(-np.abs(diffs))[:3]
+        detail = ', '.join(f"{SKILLS[s]} {diffs[s]:+d}" for s in biggest if diffs[s])
+        print(f"  row {index.rows[p]:>8}  {str(index.position[p]):<8} ovr {index.overall[p]:>3}  "
+              f"dist {d:6.2f}  {detail}")
+
+
+def run_query(index, height, query, args):
+    start = time.perf_counter()
+    if args.radius is not None:
+        dist, pos = index.radius(height, query, args.radius)
+    else:
+        dist, pos = index.knn(height, query, args.k)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{format_height(height)}: {len(pos)} matches in {elapsed:.3f} ms")
+    print_matches(index, dist, pos, query)
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Closest real builds to a slider vector")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='Build and save an index from a corpus')
+    build.add_argument('corpus', help='Path to build CSV or .npz corpus cache')
+    build.add_argument('--out', required=True, help='Where to write the index (.npz)')
+    build.add_argument('--overall', type=int, help='Only index builds with this overall rating')
+
+    query = sub.add_parser('query', help='Query a saved index')
+    query.add_argument('index', help='Index written by the build command')
+    query.add_argument('--height', help="Height as 6'8 or inches (required with --skills)")
+    query.add_argument('--skills', help=f'{len(SKILLS)} comma-separated skill values in standard order')
+    query.add_argument('-k', type=int, default=5, help='Number of neighbours (default: 5)')
+    query.add_argument('--radius', type=float, help='Return all builds within this distance instead of k-NN')
+    query.add_argument('--brute', action='store_true', help='Use the quantized brute-force scan instead of KD-trees')
+    args = parser.parse_args(argv)
+    if args.command == 'query' and args.k < 1:
+        parser.error("-k must be at least 1")
+
+    if args.command == 'build':
+        corpus = weight_arrays.load_corpus(args.corpus, overall=args.overall)
+        index = BuildIndex.from_corpus(corpus)
+        index.save(args.out)
+        print(f"Indexed {len(index)} builds across {len(index.heights)} heights -> {args.out}")
+        return
+
+    index = BuildIndex.load(args.index, brute=args.brute)
+    print(f"Loaded {len(index)} builds across {len(index.heights)} heights"
+          f" ({'brute force' if index.brute else 'KD-tree'})")
+
+    if args.skills:
+        height = weight_arrays.parse_height(args.height)
+        if not height:
+            parser.error("--height is required with --skills" if args.height is None else f"Could not parse --height {args.height}")
+        run_query(index, height, parse_skill_vector(args.skills), args)
+        return
+
+    print(f"Enter: height followed by {len(SKILLS)} skill values (Ctrl-D to quit)")
+    for line in sys.stdin:
+        parts = line.split(None, 1)
+        if len(parts) != 2:
+            continue
+        try:
+            height = weight_arrays.parse_height(parts[0])
+            if not height:
+                raise ValueError(f"Could not parse height: {parts[0]}")
+            run_query(index, height, parse_skill_vector(parts[1]), args)
+        except ValueError as exc:
+            print(f"  {exc}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Compact fixed-width records for saved builds.
+
+Each build is 24 bytes:
+
+  offset  size  field
+  0       1     height in inches (uint8)
+  1       1     wingspan in inches (uint8)
+  2       1     weight in lbs minus WEIGHT_OFFSET (uint8, so 120-375)
+  3       21    skill values in weight_arrays.SKILLS order (uint8 each)
+
+An archive file is a 12-byte header followed by the records and an optional
+UTF-8 JSON trailer with per-build metadata (id, name, createdAt, updatedAt):
+
+  b'BLDR', version (uint8), record size (uint8), 2 reserved bytes, count (uint32 LE)
+
+Records decode straight into a NumPy structured array with np.frombuffer, so
+a whole archive is scored, validated and badge-evaluated without a Python
+loop over builds.
+"""
+
+import json
+import struct
+
+import weight_arrays
+from skill_schema import SKILLS, skill_index
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+MAGIC = b'BLDR'
+VERSION = 1
+HEADER = struct.Struct('<4sBBxxI')
+
+# The app's weight stepper runs from 120 to 360 lbs
+WEIGHT_OFFSET = 120
+
+# New builds in the app start at wingspan = height + 4 and 210 lbs
+DEFAULT_WINGSPAN_OVER_HEIGHT = 4
+DEFAULT_WEIGHT = 210
+
+RECORD_DTYPE = np.dtype([
+    ('height', 'u1'),
+    ('wingspan', 'u1'),
+    ('weight', 'u1'),
+    ('skills', 'u1', (len(SKILLS),)),
+])
+
+METADATA_FIELDS = ('id', 'name', 'createdAt', 'updatedAt')
+
+
+def _check_range(name, values, low, high):
+    bad = np.flatnonzero((values < low) | (values > high))
+    if len(bad):
+        raise ValueError(f"Build {bad[0]} has {name} {values[bad[0]]}, outside the record range {low}-{high}")
+
+
+def encode_records(heights, wingspans, weights, skills):
+    """
+    Pack build arrays into a RECORD_DTYPE array.
+
+    Raises ValueError if any field does not fit its byte; use the check
+    command of saved_builds.py to find values the app itself would reject.
+    """
+    heights = np.asarray(heights, dtype=np.int64)
+    wingspans = np.asarray(wingspans, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    skills = np.asarray(skills, dtype=np.int64).reshape(-1, len(SKILLS))
+    _check_range('height', heights, 0, 255)
+    _check_range('wingspan', wingspans, 0, 255)
+    _check_range('weight', weights, WEIGHT_OFFSET, WEIGHT_OFFSET + 255)
+    bad = np.flatnonzero(((skills < 0) | (skills > 255)).any(axis=1))
+    if len(bad):
+        raise ValueError(f"Build {bad[0]} has skill values outside 0-255")
+
+    records = np.zeros(len(heights), dtype=RECORD_DTYPE)
+    records['height'] = heights
+    records['wingspan'] = wingspans
+    records['weight'] = weights - WEIGHT_OFFSET
+    records['skills'] = skills
+    return records
+
+
+def decode_records(records):
+    """Unpack a RECORD_DTYPE array into the corpus layout used by weight_arrays."""
+    return {
+        'height': records['height'].astype(np.int16),
+        'wingspan': records['wingspan'].astype(np.int16),
+        'weight': records['weight'].astype(np.int16) + WEIGHT_OFFSET,
+        'skills': np.ascontiguousarray(records['skills']),
+    }
+
+
+def _saved_number(i, name, value):
+    try:
+        return int(round(float(value)))
+    except (TypeError, ValueError):
+        raise ValueError(f"Build {i} has non-numeric {name} {value!r}") from None
+
+
+def builds_from_saved(saved):
+    """
+    Convert the app's saved-build objects (buildStorage.js) into
+    (records, metadata).
+
+    Skill names in `values` are matched case-insensitively. Missing skills,
+    wingspan and weight take a fresh build's defaults (25, height + 4 and
+    210 lbs); values that are present but not numbers raise ValueError.
+    """
+    n = len(saved)
+    heights = np.zeros(n, dtype=np.int64)
+    wingspans = np.zeros(n, dtype=np.int64)
+    weights = np.zeros(n, dtype=np.int64)
+    skills = np.full((n, len(SKILLS)), weight_arrays.MIN_VALUE, dtype=np.int64)
+    metadata = []
+    for i, build in enumerate(saved):
+        heights[i] = weight_arrays.parse_height(build.get('heightInches', build.get('height'))) or 0
+        wingspan = build.get('wingspan')
+        if wingspan in (None, ''):
+            wingspans[i] = heights[i] + DEFAULT_WINGSPAN_OVER_HEIGHT
+        else:
+            wingspans[i] = weight_arrays.parse_height(wingspan) or _saved_number(i, 'wingspan', wingspan)
+        weight = build.get('weight')
+        weights[i] = DEFAULT_WEIGHT if weight in (None, '') else _saved_number(i, 'weight', weight)
+        for name, value in (build.get('values') or {}).items():
+            idx = skill_index(name)
+            if idx is not None:
+                skills[i, idx] = _saved_number(i, name, value)
+        metadata.append({key: build[key] for key in METADATA_FIELDS if key in build})
+    return encode_records(heights, wingspans, weights, skills), metadata
+
+
+def saved_from_builds(records, metadata=None):
+    """Turn records (and optional metadata) back into buildStorage.js objects."""
+    builds = []
+    for i, record in enumerate(records):
+        build = dict(metadata[i]) if metadata else {}
+        build.update({
+            'heightInches': int(record['height']),
+            'wingspan': int(record['wingspan']),
+            'weight': int(record['weight']) + WEIGHT_OFFSET,
+            'values': {skill: int(v) for skill, v in zip(SKILLS, record['skills'])},
+        })
+        builds.append(build)
+    return builds
+
+
+def write_archive(path, records, metadata=None):
+    """Write records, plus an optional metadata trailer, as an archive file."""
+    records = np.ascontiguousarray(records, dtype=RECORD_DTYPE)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, len(records)))
+        f.write(records.tobytes())
+        if metadata:
+            f.write(json.dumps(metadata, separators=(',', ':')).encode('utf-8'))
+
+
+def read_archive(path):
+    """Read an archive file into (records, metadata or None)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is too short to be a build archive")
+    magic, version, record_size, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a build archive")
+    if version != VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path} uses record format v{version} ({record_size} bytes), expected v{VERSION}")
+    end = HEADER.size + count * record_size
+    if len(data) < end:
+        raise ValueError(f"{path} is truncated: expected {count} records")
+    records = np.frombuffer(data, dtype=RECORD_DTYPE, count=count, offset=HEADER.size)
+    trailer = data[end:]
+    return records, json.loads(trailer.decode('utf-8')) if trailer else None
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Load the app's attribute constraints, badges and skill groups into Python.
+
+src/data/attributeConstraints.js, src/data/badges.js and
+src/data/skillGroups.js are the source of truth for the app. This module reads
+them directly (they are plain object literals) so the Python tools validate
+and badge-evaluate builds with the same rules the app uses, without keeping a
+second copy in sync.
+"""
+
+import re
+from pathlib import Path
+
+from skill_schema import SKILLS
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+ROOT = Path(__file__).parent.parent
+CONSTRAINTS_FILE = ROOT / 'src' / 'data' / 'attributeConstraints.js'
+BADGES_FILE = ROOT / 'src' / 'data' / 'badges.js'
+SKILL_GROUPS_FILE = ROOT / 'src' / 'data' / 'skillGroups.js'
+
+SKILL_INDEX = {skill: i for i, skill in enumerate(SKILLS)}
+
+# Heights covered by the app's height picker (5'9" - 7'4")
+MIN_HEIGHT = 69
+MAX_HEIGHT = 88
+
+_STRING = r"""(?:'([^']*)'|"([^"]*)")"""
+
+
+def _string_value(match, group=1):
+    return match.group(group) if match.group(group) is not None else match.group(group + 1)
+
+
+def _object_blocks(source, start):
+    """Yield the text of each top-level {...} literal in the array opening at start."""
+    depth = 0
+    block_start = None
+    for i in range(start, len(source)):
+        ch = source[i]
+        if ch == '{':
+            if depth == 0:
+                block_start = i
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                yield source[block_start:i + 1]
+        elif ch == ']' and depth == 0:
+            return
+
+
+def _array_start(source, name):
+    match = re.search(rf"export const {name}\s*=\s*\[", source)
+    if not match:
+        raise ValueError(f"{name} array not found")
+    return match.end()
+
+
+def load_constraints(constraints_file=CONSTRAINTS_FILE):
+    """
+    Parse ATTRIBUTE_CONSTRAINTS into a list of dicts:
+      {'primary': str, 'dependent': str, 'constraint': [{'height': int|None, 'maxDifference': int}]}
+    """
+    with open(constraints_file, 'r') as f:
+        source = f.read()
+    # Drop line comments so example constraints in comments are not picked up
+    source = re.sub(r"//[^\n]*", '', source)
+
+    constraints = []
+    for block in _object_blocks(source, _array_start(source, 'ATTRIBUTE_CONSTRAINTS')):
+        primary = re.search(rf"primary:\s*{_STRING}", block)
+        dependent = re.search(rf"dependent:\s*{_STRING}", block)
+        entries = [
+            {'height': None if height == 'null' else int(height), 'maxDifference': int(diff)}
+            for height, diff in re.findall(r"height:\s*(null|\d+)\s*,\s*maxDifference:\s*(\d+)", block)
+        ]
+        constraints.append({
+            'primary': _string_value(primary),
+            'dependent': _string_value(dependent),
+            'constraint': entries,
+        })
+    return constraints
+
+
+def compile_constraints(constraints):
+    """
+    Turn constraint definitions into arrays for vectorized checking.
+
+    Returns a dict with primary/dependent skill indices, shape (C,), and
+    max_diff, shape (MAX_HEIGHT + 1, C), holding the allowed difference per
+    height (inf where the constraint does not apply). As in the app, the first
+    entry matching a height (or with height null) wins.
+    """
+    max_diff = np.full((MAX_HEIGHT + 1, len(constraints)), np.inf)
+    for ci, definition in enumerate(constraints):
+        for height in range(MAX_HEIGHT + 1):
+            entry = next((e for e in definition['constraint'] if e['height'] is None or e['height'] == height), None)
+            if entry is not None:
+                max_diff[height, ci] = entry['maxDifference']
+    return {
+        'primary': np.array([SKILL_INDEX[c['primary']] for c in constraints], dtype=np.int64),
+        'dependent': np.array([SKILL_INDEX[c['dependent']] for c in constraints], dtype=np.int64),
+        'max_diff': max_diff,
+        'definitions': constraints,
+    }
+
+
+def constraint_violations(compiled, heights, skills):
+    """
+    Boolean (N, C) matrix: True where a build's primary exceeds its dependent
+    by more than the allowed difference at that build's height.
+    """
+    heights = np.clip(np.asarray(heights, dtype=np.int64), 0, MAX_HEIGHT)
+    skills = np.asarray(skills, dtype=np.int16)
+    diffs = skills[:, compiled['primary']] - skills[:, compiled['dependent']]
+    return diffs > compiled['max_diff'][heights]
+
+
+def load_skill_groups(skill_groups_file=SKILL_GROUPS_FILE):
+    """Parse SKILL_GROUPS into an ordered {group name: [skills]} dict."""
+    with open(skill_groups_file, 'r') as f:
+        source = f.read()
+    return {
+        name: [_string_value(m) for m in re.finditer(_STRING, skills)]
+        for name, skills in re.findall(r"(\w+):\s*{[^}]*?skills:\s*\[([^\]]*)\]", source)
+    }
+
+
+def _parse_level(block):
+    """Return (requirements, logic) for one level literal: [(skill_key, threshold)], 'and'|'or'."""
+    threshold = re.search(r"threshold:\s*(\d+)", block)
+    if threshold:
+        return [(None, int(threshold.group(1)))], 'and'
+    check = re.search(r"check:\s*\(p\)\s*=>\s*(.+?)(?:,\s*$|\s*}\s*$)", block, re.S)
+    if not check:
+        raise ValueError(f"Level has neither threshold nor check: {block}")
+    expr = check.group(1)
+    terms = re.findall(r"p\.(\w+)\s*>=\s*(\d+)", expr)
+    has_and, has_or = '&&' in expr, '||' in expr
+    if has_and and has_or:
+        raise ValueError(f"Mixed && / || in badge check: {expr}")
+    return [(key, int(value)) for key, value in terms], 'or' if has_or else 'and'
+
+
+def load_badges(badges_file=BADGES_FILE):
+    """
+    Parse BADGES into a list of dicts with id, name, categories, attributes,
+    attributeLogic, minHeight, maxHeight and levels. Each level is
+      {'level': int, 'label': str, 'requirements': [(skill, threshold)], 'logic': 'and'|'or'}
+    where the build unlocks the level if all ('and') or any ('or') of the
+    requirements are met.
+    """
+    with open(badges_file, 'r') as f:
+        source = f.read()
+
+    badges = []
+    for block in _object_blocks(source, _array_start(source, 'BADGES')):
+        progress_src = block[block.index('getProgress'):]
+        progress_keys = dict(re.findall(r"(\w+):\s*values\['([^']+)'\]", progress_src))
+        progress_skills = re.findall(r"values\['([^']+)'\]", progress_src)
+
+        levels_src = block[block.index('levels:'):block.index('getProgress')]
+        levels = []
+        for level_block in _object_blocks(levels_src, levels_src.index('[') + 1):
+            requirements, logic = _parse_level(level_block)
+            if requirements[0][0] is None:
+                # Plain threshold against a single value or Math.max(...) of several
+                requirements = [(skill, requirements[0][1]) for skill in progress_skills]
+                logic = 'or'
+            else:
+                requirements = [(progress_keys[key], value) for key, value in requirements]
+            levels.append({
+                'level': int(re.search(r"level:\s*(\d+)", level_block).group(1)),
+                'label': _string_value(re.search(rf"label:\s*{_STRING}", level_block)),
+                'requirements': requirements,
+                'logic': logic,
+            })
+
+        badges.append({
+            'id': _string_value(re.search(rf"id:\s*{_STRING}", block)),
+            'name': _string_value(re.search(rf"name:\s*{_STRING}", block)),
+            'categories': [_string_value(m) for m in re.finditer(_STRING, re.search(r"categories:\s*\[([^\]]*)\]", block).group(1))],
+            'attributes': [_string_value(m) for m in re.finditer(_STRING, re.search(r"attributes:\s*\[([^\]]*)\]", block).group(1))],
+            'attributeLogic': re.search(r"attributeLogic:\s*'(\w+)'", block).group(1),
+            'minHeight': int(re.search(r"minHeight:\s*(\d+)", block).group(1)),
+            'maxHeight': int(re.search(r"maxHeight:\s*(\d+)", block).group(1)),
+            'levels': levels,
+        })
+    return badges
+
+
+def compile_badges(badges):
+    """
+    Compile badge definitions into lookup tables for vectorized evaluation.
+
+    Every badge becomes a few terms, one per skill its levels test. Term k
+    gets a row of per-level thresholds (0 for skills an 'and' level does not
+    test, unreachable for an 'or' level), and since thresholds only rise with
+    the level, the levels a skill value v meets are a prefix whose length is
+    searchsorted(thresholds, v). That length is tabulated for every uint8
+    value in counts, shape (K, 256). A badge's level is then the min ('and')
+    or max ('or') of its terms' counts.
+
+    terms, shape (B, T), lists each badge's term rows, padded with a term
+    that never limits the reduction (all 255 for 'and', all 0 for 'or').
+    Badges whose thresholds do not rise monotonically, or that mix 'and' and
+    'or' levels, are listed in fallback and evaluated level by level.
+
+    Returns a dict with term_skill (K,), counts (K, 256), terms (B, T),
+    use_max (B,), level_values (B, L + 1) (badge level for each count, 0 for
+    none), window (256, B) (height eligibility), fallback and definitions.
+    """
+    max_levels = max(len(badge['levels']) for badge in badges)
+    unreachable = 256
+    # Rows 0 and 1 are the padding terms for 'or' and 'and' badges
+    term_skill = [0, 0]
+    counts = [np.zeros(256, dtype=np.uint8), np.full(256, 255, dtype=np.uint8)]
+    badge_terms = []
+    use_max = np.zeros(len(badges), dtype=bool)
+    level_values = np.zeros((len(badges), max_levels + 1), dtype=np.uint8)
+    window = np.zeros((256, len(badges)), dtype=bool)
+    fallback = []
+
+    for bi, badge in enumerate(badges):
+        window[badge['minHeight']:badge['maxHeight'] + 1, bi] = True
+        level_values[bi, 1:len(badge['levels']) + 1] = [level['level'] for level in badge['levels']]
+        # Single-requirement levels read the same under either logic
+        logic = {level['logic'] for level in badge['levels'] if len(level['requirements']) > 1} or {'and'}
+        skills = list(dict.fromkeys(skill for level in badge['levels'] for skill, _ in level['requirements']))
+
+        thresholds = np.full((len(skills), max_levels), unreachable)
+        if logic == {'and'}:
+            thresholds[:, :len(badge['levels'])] = 0
+        for li, level in enumerate(badge['levels']):
+            for skill, threshold in level['requirements']:
+                si = skills.index(skill)
+                # Several requirements on one skill: the strictest ('and') or loosest ('or') decides
+                current = thresholds[si, li]
+                thresholds[si, li] = threshold if current in (0, unreachable) else (
+                    max(current, threshold) if logic == {'and'} else min(current, threshold))
+
+        if len(logic) != 1 or (np.diff(thresholds, axis=1) < 0).any():
+            fallback.append(bi)
+            badge_terms.append([0])
+            continue
+        use_max[bi] = logic == {'or'}
+        badge_terms.append(list(range(len(term_skill), len(term_skill) + len(skills))))
+        for si, skill in enumerate(skills):
+            term_skill.append(SKILL_INDEX[skill])
+            counts.append(np.searchsorted(thresholds[si], np.arange(256), side='right').astype(np.uint8))
+
+    width = max(len(t) for t in badge_terms)
+    terms = np.array([t + [0 if use_max[bi] else 1] * (width - len(t)) for bi, t in enumerate(badge_terms)], dtype=np.int64)
+    return {
+        'term_skill': np.array(term_skill, dtype=np.int64),
+        'counts': np.array(counts, dtype=np.uint8),
+        'terms': terms,
+        'use_max': use_max,
+        'level_values': level_values,
+        'window': window,
+        'fallback': fallback,
+        'definitions': badges,
+    }
+
+
+def _evaluate_levels(badge, heights, skills):
+    """Level-by-level evaluation of one badge; the last satisfied level wins."""
+    result = np.zeros(len(heights), dtype=np.uint8)
+    eligible = (heights >= badge['minHeight']) & (heights <= badge['maxHeight'])
+    for level in badge['levels']:
+        met = np.stack([skills[:, SKILL_INDEX[skill]] >= threshold for skill, threshold in level['requirements']])
+        unlocked = met.any(axis=0) if level['logic'] == 'or' else met.all(axis=0)
+        result[unlocked & eligible] = level['level']
+    return result
+
+
+def evaluate_badges(compiled, heights, skills, chunk_size=1 << 14):
+    """
+    Highest unlocked level of every badge for every build, shape (N, B).
+
+    compiled comes from compile_badges. 0 means not unlocked (or height not
+    eligible), matching evaluateBadges in badges.js.
+    """
+    heights = np.clip(np.asarray(heights, dtype=np.int64), 0, 255)
+    skills = np.clip(np.asarray(skills), 0, 255).astype(np.uint8)
+    counts = compiled['counts'].ravel()
+    level_values = compiled['level_values'].ravel()
+    # Works on (terms, builds) so every gather below reads contiguous rows, and
+    # keeps flat indices in the smallest integer type that holds them
+    term_offsets = (np.arange(len(compiled['term_skill'])) * 256).astype(np.min_scalar_type(len(counts)))[:, None]
+    level_offsets = (np.arange(len(compiled['terms'])) * compiled['level_values'].shape[1])
+    level_offsets = level_offsets.astype(np.min_scalar_type(len(level_values)))[:, None]
+    use_max = compiled['use_max'][:, None]
+    result = np.empty((len(heights), len(compiled['terms'])), dtype=np.uint8)
+
+    for start in range(0, len(heights), chunk_size):
+        stop = start + chunk_size
+        values = np.ascontiguousarray(skills[start:stop].T)[compiled['term_skill']]
+        met = counts[term_offsets + values]
+        reached = met[compiled['terms'][:, 0]]
+        for t in range(1, compiled['terms'].shape[1]):
+            other = met[compiled['terms'][:, t]]
+            reached = np.where(use_max, np.maximum(reached, other), np.minimum(reached, other))
+        # Count 0 maps to level 0, so ineligible heights just zero the count
+        reached *= compiled['window'][heights[start:stop]].T
+        result[start:stop] = level_values[level_offsets + reached].T
+
+    for bi in compiled['fallback']:
+        result[:, bi] = _evaluate_levels(compiled['definitions'][bi], heights, skills)
+    return result
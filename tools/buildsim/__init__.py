@@ -0,0 +1,114 @@
+"""
+One entry point and an in-process API for the scripts in tools/.
+
+  python tools/buildsim <command> [args...]
+  python tools/buildsim --help
+
+Each subcommand is one of the existing scripts, imported only when it runs,
+so --help and the light commands start without loading NumPy or SciPy.
+
+Batch jobs can call the same code without spawning a process per call:
+
+  sys.path.insert(0, 'tools')
+  import buildsim
+
+  table = buildsim.load_cost_table()
+  totals = buildsim.build_totals(table, heights, skills, nearest=True)
+  buildsim.run(['fit', 'builds.csv', '--joint-heights'])
+
+Names in API resolve on first access by importing the script that defines
+them; the skill schema (SKILLS, parse_height, find_skill_key, ...) is always
+loaded, since it is standard library only.
+"""
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+
+# The scripts import each other as top-level modules
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from skill_schema import SKILLS, MIN_VALUE, MAX_VALUE, NUM_VALUES, canonical_skill, find_skill_key, format_height, parse_height, skill_index
+
+# Public name -> script in tools/ (file stem) that defines it
+API = {
+    'load_cost_table': 'weight_arrays',
+    'cost_table_from_dict': 'weight_arrays',
+    'read_weight_cap': 'weight_arrays',
+    'skill_costs': 'weight_arrays',
+    'build_totals': 'weight_arrays',
+    'valid_sliders': 'weight_arrays',
+    'marginal_costs': 'weight_arrays',
+    'cap_sweep': 'weight_arrays',
+    'load_corpus': 'weight_arrays',
+    'save_corpus': 'weight_arrays',
+    'load_constraints': 'build_rules',
+    'compile_constraints': 'build_rules',
+    'constraint_violations': 'build_rules',
+    'load_badges': 'build_rules',
+    'compile_badges': 'build_rules',
+    'evaluate_badges': 'build_rules',
+    'encode_records': 'build_records',
+    'decode_records': 'build_records',
+    'read_archive': 'build_records',
+    'write_archive': 'build_records',
+    'load_builds': 'saved_builds',
+    'check_builds': 'saved_builds',
+    'Tables': 'scoring_service',
+    'parse_builds': 'scoring_service',
+    'score_batch': 'scoring_service',
+    'validate_batch': 'scoring_service',
+    'badges_batch': 'scoring_service',
+    'BuildIndex': 'build_index',
+    'minibatch_kmeans': 'discover_archetypes',
+    'table_deltas': 'diff_build_weights',
+    'build_lookup': 'generate_weight_lookup',
+    'fit_interactions': 'fit_interaction_weights',
+    'fit_interactions_joint': 'fit_interaction_weights',
+    'load_build_data_csv': 'reverse-engineer-weights',
+    'optimize_weights_joint': 'reverse-engineer-weights',
+    'optimize_weights_cross_height': 'reverse-engineer-weights',
+}
+
+
+def load_tool(name):
+    """
+    Import a script in tools/ by file stem. Hyphenated scripts
+    (reverse-engineer-weights) are registered under an underscored name.
+    """
+    module_name = name.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    if module_name == name:
+        return importlib.import_module(name)
+    spec = importlib.util.spec_from_file_location(module_name, TOOLS_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def run(argv):
+    """Run a subcommand in this process, e.g. run(['score', 'builds.csv']). Returns its exit status."""
+    from buildsim import cli
+    return cli.run(list(argv))
+
+
+def __getattr__(name):
+    if name in API:
+        value = getattr(load_tool(API[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'buildsim' has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(API))
@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+if not __package__:
+    # Run as a directory (python tools/buildsim): make tools/ importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from buildsim.cli import main
+
+sys.exit(main())
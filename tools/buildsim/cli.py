@@ -0,0 +1,83 @@
+"""
+Subcommand dispatch for python tools/buildsim.
+
+Each command imports its script and calls main(argv, prog) with the
+remaining arguments, so the script's own --help and options apply. Nothing
+beyond argparse and the skill schema is imported until a command is chosen,
+and the scripts themselves load NumPy and SciPy only on first use.
+"""
+
+import argparse
+import json
+import sys
+
+from buildsim import load_tool
+from skill_schema import SKILLS, MIN_VALUE, MAX_VALUE
+
+# Command -> (script in tools/, summary)
+COMMANDS = {
+    'score': ('calculate-total-weights', 'Total weight per build; cap sweep and marginal costs with --sweep'),
+    'fit': ('reverse-engineer-weights', 'Fit per-value skill weights to a build corpus'),
+    'fit-interactions': ('fit_interaction_weights', 'Fit pairwise skill interaction weights on top of the table'),
+    'vc-create': ('create_vc_weights_csv', 'Enter cumulative VC costs and write a VC weights CSV'),
+    'diff': ('diff_build_weights', 'Compare two weight tables and their impact on a corpus'),
+    'lookup': ('generate_weight_lookup', "Regenerate the app's precomputed weight lookup tables"),
+    'index': ('build_index', 'Build or query the nearest-neighbour build index'),
+    'archetypes': ('discover_archetypes', 'Cluster a corpus into per-height archetypes'),
+    'saved': ('saved_builds', 'Import, export and check saved-build archives'),
+    'badges': ('badge_prevalence', 'Badge prevalence per height across a corpus'),
+    'serve': ('scoring_service', 'Long-lived local batch scoring service'),
+    'skills': (None, 'Print the canonical skill schema'),
+}
+
+
+def build_parser():
+    epilog = "commands:\n" + "\n".join(f"  {name:<18}{summary}" for name, (_, summary) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog='buildsim',
+        description="Build weight tooling. Run `buildsim <command> --help` for a command's options.",
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('command', choices=list(COMMANDS), metavar='command', help='One of the commands below')
+    return parser
+
+
+def print_skills(argv):
+    parser = argparse.ArgumentParser(prog='buildsim skills', description='Print the canonical skill schema')
+    parser.add_argument('--json', action='store_true', help='Print as JSON')
+    args = parser.parse_args(argv)
+    if args.json:
+        print(json.dumps({'skills': SKILLS, 'minValue': MIN_VALUE, 'maxValue': MAX_VALUE}))
+        return
+    for i, skill in enumerate(SKILLS):
+        print(f"{i:>2}  {skill}")
+    print(f"\nSlider values {MIN_VALUE}-{MAX_VALUE}")
+
+
+def run(argv):
+    """Run one command in this process and return its exit status."""
+    parser = build_parser()
+    try:
+        if not argv or argv[0].startswith('-'):
+            # Only --help (or a mistake) can come before the command
+            parser.parse_args(argv)
+        command = parser.parse_args(argv[:1]).command
+        script = COMMANDS[command][0]
+        if script is None:
+            print_skills(argv[1:])
+        else:
+            load_tool(script).main(argv[1:], prog=f'buildsim {command}')
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None):
+    try:
+        return run(sys.argv[1:] if argv is None else list(argv))
+    except KeyboardInterrupt:
+        return 130
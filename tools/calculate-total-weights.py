@@ -2,33 +2,21 @@
 """
 Calculate total weights for builds using existing build_weights.json.
 Useful for finding the total weight that corresponds to 99 overall rating.
+
+With --sweep, runs the vectorized analytics instead: totals for the whole
+corpus in one pass, the fraction of builds that fit under a range of candidate
+caps, and the average cost of +1 in each skill.
 """
 
 import json
 import csv
-import re
-import numpy as np
 from pathlib import Path
 
-SKILLS = [
-    'Close Shot', 'Driving Layup', 'Driving Dunk', 'Standing Dunk', 'Post Control',
-    'Mid Range Shot', 'Three Point Shot', 'Free Throw', 'Pass Accuracy', 'Ball Handle',
-    'Speed with Ball', 'Interior Defense', 'Perimeter Defense', 'Steal', 'Block',
-    'Offensive Rebound', 'Defensive Rebound', 'Speed', 'Agility', 'Strength', 'Vertical'
-]
-
-def parse_height(height_str):
-    """Parse height string in format X'Y to total inches."""
-    if isinstance(height_str, int):
-        return height_str
-    
-    height_str = str(height_str).strip()
-    match = re.search(r"(\d+)\s*[^\d]+\s*(\d+)", height_str)
-    if match:
-        feet = int(match.group(1))
-        inches = int(match.group(2))
-        return feet * 12 + inches
-    return None
+import weight_arrays
+from skill_schema import SKILLS, format_height, parse_height
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
 
 def load_weights(weights_file):
     """Load build_weights.json."""
@@ -50,11 +38,13 @@ def calculate_build_weight(build, weights_data):
     for skill in SKILLS:
         skill_value = build['skills'][skill]
         
-        if skill not in height_weights:
+        # Table keys differ in casing ('Speed With Ball'), match like getWeight.js
+        skill_key = weight_arrays.find_skill_key(height_weights, skill)
+        if skill_key is None:
             continue
         
-        skill_weights_array = height_weights[skill]
-        
+        skill_weights_array = height_weights[skill_key]
+
         # Sum all weights from 25 up to skill_value (no bucket multipliers)
         for val in range(25, skill_value + 1):
             index = val - 25
@@ -105,15 +95,100 @@ def load_builds_from_csv(csv_file):
     
     return builds
 
-def main():
+def parse_caps(caps_str, weight_cap):
+    """Parse START:STOP:STEP into an array of candidate caps (inclusive of STOP)."""
+    if not caps_str:
+        return np.arange(0.5 * weight_cap, 1.5 * weight_cap + 1, 1.0)
+    start, stop, step = (float(x) for x in caps_str.split(':'))
+    return np.arange(start, stop + step / 2, step)
+
+
+def run_analytics(args, weights_file):
+    """Cap sweep and marginal-cost report over the whole corpus, vectorized."""
+    table = weight_arrays.load_cost_table(weights_file)
+    weight_cap = args.cap or weight_arrays.read_weight_cap()
+
+    print(f"Loading builds from {args.csv_file}...")
+    corpus = weight_arrays.load_corpus(args.csv_file, overall=args.overall)
+    print(f"Loaded {len(corpus['height'])} builds")
+
+    totals = weight_arrays.build_totals(table, corpus['height'], corpus['skills'])
+    known = ~np.isnan(totals)
+    if not known.any():
+        print("Could not calculate weights for any builds")
+        return
+    if not known.all():
+        print(f"Skipped {int((~known).sum())} builds with heights not in the weight table")
+
+    caps = parse_caps(args.caps, weight_cap)
+    heights = np.unique(corpus['height'][known])
+    overall_fit = weight_arrays.cap_sweep(totals, caps)
+    # The configured cap rides along as an extra last column for the per-height report
+    height_fit = {h: weight_arrays.cap_sweep(totals[corpus['height'] == h], np.append(caps, weight_cap)) for h in heights}
+
+    # Show a handful of evenly spaced caps plus the configured one
+    shown = np.unique(np.append(caps[np.linspace(0, len(caps) - 1, min(len(caps), 9)).astype(int)], weight_cap))
+    shown_fit = weight_arrays.cap_sweep(totals, shown)
+    print(f"\nCap sweep over {len(caps)} caps (WEIGHT_CAP = {weight_cap:,.0f}):")
+    print("-" * 40)
+    print(f"{'Cap':>10} {'Builds that fit':>18}")
+    print("-" * 40)
+    for cap, frac in zip(shown, shown_fit):
+        marker = '  <- WEIGHT_CAP' if cap == weight_cap else ''
+        print(f"{cap:>10,.0f} {frac:>17.1%}{marker}")
+
+    print(f"\nPer height at WEIGHT_CAP:")
+    for h in heights:
+        print(f"  {format_height(h)}: {height_fit[h][-1]:.1%}")
+
+    for target in (0.5, 0.9, 0.99):
+        idx = np.searchsorted(overall_fit, target)
+        if idx < len(caps):
+            print(f"  Smallest cap fitting {target:.0%} of builds: {caps[idx]:,.0f}")
+
+    # Marginal cost of +1 in each skill, whole corpus at once
+    marginal = weight_arrays.marginal_costs(table, corpus['height'][known], corpus['skills'][known])
+    # Only builds under the cap can be pushed over it
+    breach = (totals[known] <= weight_cap)[:, None] & (totals[known][:, None] + marginal > weight_cap)
+    print(f"\nMarginal cost of +1 per skill, to the next valid value (across {int(known.sum())} builds):")
+    print("-" * 64)
+    print(f"{'Skill':<20} {'Mean':>8} {'Median':>8} {'Max':>8} {'Pushes over cap':>16}")
+    print("-" * 64)
+    for si, skill in enumerate(SKILLS):
+        col = marginal[:, si]
+        if np.isnan(col).all():
+            print(f"{skill:<20} {'(all at 99)':>8}")
+            continue
+        print(f"{skill:<20} {np.nanmean(col):>8.2f} {np.nanmedian(col):>8.2f} {np.nanmax(col):>8.2f} "
+              f"{breach[:, si].mean():>15.1%}")
+
+    if args.sweep_out:
+        with open(args.sweep_out, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['cap', 'all'] + [str(h) for h in heights])
+            for ci, cap in enumerate(caps):
+                writer.writerow([f"{cap:g}", f"{overall_fit[ci]:.6f}"] + [f"{height_fit[h][ci]:.6f}" for h in heights])
+        print(f"\nWrote full sweep to {args.sweep_out}")
+
+
+def main(argv=None, prog=None):
     import argparse
-    parser = argparse.ArgumentParser(description="Calculate total weights for builds")
-    parser.add_argument('csv_file', help='Path to CSV file with builds')
+    parser = argparse.ArgumentParser(prog=prog, description="Calculate total weights for builds")
+    parser.add_argument('csv_file', help='Path to CSV file with builds (or .npz corpus cache)')
     parser.add_argument('--overall', type=int, help='Filter by overall rating (e.g., 99)')
-    args = parser.parse_args()
+    parser.add_argument('--sweep', action='store_true', help='Run cap sweep and marginal-cost analytics instead of listing builds')
+    parser.add_argument('--caps', help='Candidate caps as START:STOP:STEP (default: 50%%-150%% of WEIGHT_CAP in steps of 1)')
+    parser.add_argument('--cap', type=float, help='Cap to report against (default: WEIGHT_CAP from src/config.js)')
+    parser.add_argument('--sweep-out', help='Write the fit fraction for every cap and height to this CSV')
+    args = parser.parse_args(argv)
     
     # Load weights
     weights_file = Path(__file__).parent.parent / 'src' / 'data' / 'build_weights.json'
+
+    if args.sweep:
+        run_analytics(args, weights_file)
+        return
+
     print(f"Loading weights from {weights_file}...")
     weights_data = load_weights(weights_file)
     
@@ -4,6 +4,7 @@ Script to create a VC weights CSV file from user input.
 Reads the template from vc_weight_template.csv and populates it with transformed data.
 """
 
+import argparse
 import csv
 import os
 from pathlib import Path
@@ -149,7 +150,14 @@ def get_user_input(row_name):
     return starting_column, numbers
 
 
-def main():
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Create a VC weights CSV from cumulative values entered row by row",
+        epilog="Prompts for each row of src/resources/vc_weight_template.csv and writes the result to src/resources/vc_weights/.",
+    )
+    parser.parse_args(argv)
+
     # Set up paths
     script_dir = Path(__file__).parent
     workspace_root = script_dir.parent
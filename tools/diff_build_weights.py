@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Compare two build_weights tables and report their impact on a build corpus.
+
+Run this before copying build_weights_engineered.json over build_weights.json:
+it shows how per-height, per-skill costs change, which builds cross WEIGHT_CAP
+and which builds move the most. Heights missing from a table fall back to the
+closest height, the same way getWeight.js resolves them in the app.
+
+Usage:
+  python tools/diff_build_weights.py builds.csv
+  python tools/diff_build_weights.py builds.npz --old a.json --new b.json --max-crossings 0
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import weight_arrays
+from skill_schema import SKILLS, format_height
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+DATA_DIR = Path(__file__).parent.parent / 'src' / 'data'
+
+
+def table_deltas(old_table, new_table):
+    """
+    Per-height, per-skill cost changes for heights present in both tables.
+
+    Returns (heights, full_cost_delta, max_step_delta, validity_changes) where
+    full_cost_delta is the change in cost of going from 25 to 99 and
+    max_step_delta the largest absolute change of any single value, each of
+    shape (H, 21).
+    """
+    heights = np.intersect1d(old_table['heights'], new_table['heights'])
+    old_rows = old_table['height_index'][heights]
+    new_rows = new_table['height_index'][heights]
+    old_step, new_step = old_table['step'][old_rows], new_table['step'][new_rows]
+
+    full_cost_delta = new_table['cum'][new_rows, :, -1] - old_table['cum'][old_rows, :, -1]
+    max_step_delta = np.abs(new_step - old_step).max(axis=2)
+    validity_changes = (old_table['valid'][old_rows] != new_table['valid'][new_rows]).sum(axis=2)
+    return heights, full_cost_delta, max_step_delta, validity_changes
+
+
+def build_deltas(old_table, new_table, heights, skills):
+    """Totals of every build under both tables and their difference."""
+    old_totals = weight_arrays.build_totals(old_table, heights, skills, nearest=True)
+    new_totals = weight_arrays.build_totals(new_table, heights, skills, nearest=True)
+    return old_totals, new_totals, new_totals - old_totals
+
+
+def top_movers(delta, count):
+    """Indices of the builds with the largest absolute change, largest first."""
+    count = min(count, len(delta))
+    if not count:
+        return np.array([], dtype=np.int64)
+    idx = np.argpartition(-np.abs(delta), count - 1)[:count]
+    return idx[np.argsort(-np.abs(delta[idx]))]
+
+
+def print_table_report(old_table, new_table):
+    heights, full_cost_delta, max_step_delta, validity_changes = table_deltas(old_table, new_table)
+
+    only_old = np.setdiff1d(old_table['heights'], new_table['heights'])
+    only_new = np.setdiff1d(new_table['heights'], old_table['heights'])
+    if len(only_old):
+        print(f"Heights only in old table (new table uses closest height): {[format_height(h) for h in only_old]}")
+    if len(only_new):
+        print(f"Heights only in new table: {[format_height(h) for h in only_new]}")
+
+    print(f"\nCost of 25 -> 99 per skill, new minus old ({len(heights)} shared heights):")
+    print("-" * 72)
+    print(f"{'Skill':<20} {'Mean delta':>11} {'Min delta':>11} {'Max delta':>11} {'Max step':>9} {'Null flips':>10}")
+    print("-" * 72)
+    for si, skill in enumerate(SKILLS):
+        col = full_cost_delta[:, si]
+        print(f"{skill:<20} {col.mean():>11.1f} {col.min():>11.1f} {col.max():>11.1f} "
+              f"{max_step_delta[:, si].max():>9.2f} {int(validity_changes[:, si].sum()):>10}")
+
+    print("\nTotal 25 -> 99 cost per height, new minus old:")
+    for hi, height in enumerate(heights):
+        changed = int((full_cost_delta[hi] != 0).sum())
+        print(f"  {format_height(height):<6} {full_cost_delta[hi].sum():>10.1f}  ({changed} skills changed)")
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Diff two build_weights tables against a build corpus")
+    parser.add_argument('corpus', help='Path to build CSV or .npz corpus cache')
+    parser.add_argument('--old', default=str(DATA_DIR / 'build_weights.json'), help='Current weight table (default: src/data/build_weights.json)')
+    parser.add_argument('--new', default=str(DATA_DIR / 'build_weights_engineered.json'), help='Candidate weight table (default: src/data/build_weights_engineered.json)')
+    parser.add_argument('--overall', type=int, help='Only use builds with this overall rating')
+    parser.add_argument('--cap', type=float, help='Cap to check crossings against (default: WEIGHT_CAP from src/config.js)')
+    parser.add_argument('--top', type=int, default=20, help='Number of largest movers to list (default: 20)')
+    parser.add_argument('--out', help='Write per-build old/new totals to this CSV')
+    parser.add_argument('--save-corpus', help='Cache the parsed corpus as .npz for faster reruns')
+    parser.add_argument('--max-crossings', type=int, help='Exit with status 1 if more builds than this cross the cap')
+    args = parser.parse_args(argv)
+
+    weight_cap = args.cap or weight_arrays.read_weight_cap()
+
+    print(f"Old table: {args.old}")
+    print(f"New table: {args.new}")
+    old_table = weight_arrays.load_cost_table(args.old)
+    new_table = weight_arrays.load_cost_table(args.new)
+
+    print(f"Loading builds from {args.corpus}...")
+    corpus = weight_arrays.load_corpus(args.corpus, overall=args.overall)
+    if args.save_corpus:
+        weight_arrays.save_corpus(corpus, args.save_corpus)
+        print(f"Cached corpus to {args.save_corpus}")
+    n_builds = len(corpus['height'])
+    print(f"Loaded {n_builds} builds")
+
+    print_table_report(old_table, new_table)
+
+    if not n_builds:
+        print("\nNo builds to score")
+        return
+
+    old_totals, new_totals, delta = build_deltas(old_table, new_table, corpus['height'], corpus['skills'])
+    newly_over = (old_totals <= weight_cap) & (new_totals > weight_cap)
+    newly_fit = (old_totals > weight_cap) & (new_totals <= weight_cap)
+
+    print(f"\nBuild totals (WEIGHT_CAP = {weight_cap:,.0f}):")
+    print(f"  Mean delta:        {delta.mean():+,.1f}")
+    print(f"  Mean |delta|:      {np.abs(delta).mean():,.1f}")
+    print(f"  Changed builds:    {int((delta != 0).sum()):,} / {n_builds:,}")
+    print(f"  Fit under cap:     {(old_totals <= weight_cap).mean():.1%} -> {(new_totals <= weight_cap).mean():.1%}")
+    print(f"  Newly over cap:    {int(newly_over.sum()):,}")
+    print(f"  Newly feasible:    {int(newly_fit.sum()):,}")
+
+    heights = corpus['height']
+    crossing_heights = np.unique(heights[newly_over | newly_fit])
+    if len(crossing_heights):
+        print("\nCap crossings per height (over / feasible):")
+        for height in crossing_heights:
+            at_height = heights == height
+            print(f"  {format_height(height):<6} {int((newly_over & at_height).sum()):>7,} / {int((newly_fit & at_height).sum()):,}")
+
+    movers = top_movers(delta, args.top)
+    print(f"\nLargest movers:")
+    print("-" * 64)
+    print(f"{'Row':>8} {'Position':<10} {'Height':<8} {'Old':>10} {'New':>10} {'Delta':>10}")
+    print("-" * 64)
+    for i in movers:
+        print(f"{i:>8} {str(corpus['position'][i]):<10} {format_height(int(heights[i])):<8} "
+              f"{old_totals[i]:>10,.1f} {new_totals[i]:>10,.1f} {delta[i]:>+10,.1f}")
+
+    if args.out:
+        rows = np.column_stack([np.arange(n_builds), heights, old_totals, new_totals, delta])
+        np.savetxt(args.out, rows, delimiter=',', fmt=['%d', '%d', '%.2f', '%.2f', '%.2f'],
+                   header='row,height,old_total,new_total,delta', comments='')
+        print(f"\nWrote per-build totals to {args.out}")
+
+    crossings = int(newly_over.sum() + newly_fit.sum())
+    if args.max_crossings is not None and crossings > args.max_crossings:
+        print(f"\n✗ {crossings} builds cross the cap (allowed: {args.max_crossings})")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Discover build archetypes by clustering a corpus, one height at a time.
+
+Runs mini-batch k-means on the 21 skill values of each height's builds and
+writes every centroid as a CSV in the vc_weight_template.csv layout, like the
+hand-made files create_vc_weights_csv.py produces. Each skill row starts one
+above the centroid value and holds the per-step cost from build_weights.json
+at that height, i.e. the price of upgrading the archetype in build weight, not
+VC, so the files go to their own directory rather than vc_weights/.
+
+Memory stays flat: each iteration only touches one mini-batch, and the final
+cluster sizes are counted in fixed-size chunks.
+
+Usage:
+  python tools/discover_archetypes.py builds.csv -k 4 [--overall 99] [--heights 75 80]
+"""
+
+import argparse
+import csv
+from pathlib import Path
+
+import build_rules
+import weight_arrays
+from create_vc_weights_csv import load_template, populate_csv, write_output_csv
+from skill_schema import SKILLS, MIN_VALUE, MAX_VALUE, format_height
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+ROOT = Path(__file__).parent.parent
+TEMPLATE_FILE = ROOT / 'src' / 'resources' / 'vc_weight_template.csv'
+# Not under vc_weights/: these files hold per-step build weights, not VC prices
+OUTPUT_DIR = ROOT / 'src' / 'resources' / 'discovered_archetypes'
+
+# Row names in vc_weight_template.csv that differ from the skill names
+TEMPLATE_ROW_ALIASES = {
+    'offensive rebounding': 'Offensive Rebound',
+    'defensive rebounding': 'Defensive Rebound',
+}
+
+
+def kmeans_plus_plus(data, k, rng):
+    """Pick k spread-out starting centers from data (k-means++ seeding)."""
+    centers = [data[rng.integers(len(data))]]
+    d2 = ((data - centers[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        total = d2.sum()
+        idx = rng.choice(len(data), p=d2 / total) if total > 0 else rng.integers(len(data))
+        centers.append(data[idx])
+        d2 = np.minimum(d2, ((data - data[idx]) ** 2).sum(axis=1))
+    return np.array(centers, dtype=np.float32)
+
+
+def assign(data, centers):
+    """Index of the closest center for every row."""
+    d2 = (centers ** 2).sum(axis=1)[None, :] - 2.0 * (data @ centers.T)
+    return d2.argmin(axis=1)
+
+
+def minibatch_kmeans(skills, k, batch_size=4096, max_iter=200, tol=1e-3, seed=0, chunk_size=1 << 16):
+    """
+    Mini-batch k-means over a (N, 21) uint8 skill matrix.
+
+    Each step assigns a random batch to its nearest centers and moves every
+    center toward its batch mean with a per-center learning rate of
+    batch_count / total_count. A center that has not won a single row yet is
+    moved to the batch row farthest from its own center. Returns (centers,
+    cluster sizes); a size can still be 0 when the data has fewer distinct
+    rows than k.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(skills)
+    k = min(k, n)
+    seed_rows = skills[rng.choice(n, size=min(n, 10 * batch_size), replace=False)].astype(np.float32)
+    centers = kmeans_plus_plus(seed_rows, k, rng)
+    counts = np.zeros(k)
+
+    for _ in range(max_iter):
+        batch = skills[rng.integers(0, n, size=min(batch_size, n))].astype(np.float32)
+        labels = assign(batch, centers)
+        batch_counts = np.bincount(labels, minlength=k).astype(float)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, batch)
+
+        hit = batch_counts > 0
+        counts[hit] += batch_counts[hit]
+        rate = (batch_counts[hit] / counts[hit])[:, None]
+        previous = centers.copy()
+        centers[hit] += rate * (sums[hit] / batch_counts[hit, None] - centers[hit])
+
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            far = ((batch - centers[labels]) ** 2).sum(axis=1)
+            far_rows = np.argsort(-far)[:len(empty)]
+            far_rows = far_rows[far[far_rows] > 0]
+            centers[empty[:len(far_rows)]] = batch[far_rows]
+            continue
+        if np.abs(centers - previous).max() < tol:
+            break
+
+    sizes = np.zeros(k, dtype=np.int64)
+    for start in range(0, n, chunk_size):
+        sizes += np.bincount(assign(skills[start:start + chunk_size].astype(np.float32), centers), minlength=k)
+    return centers, sizes
+
+
+def archetype_name(centroid, height, groups, corpus_mean, taken):
+    """File stem such as 80in_shooting_playmaking from the two strongest groups."""
+    lift = {
+        name: np.mean([centroid[SKILLS.index(s)] - corpus_mean[SKILLS.index(s)] for s in skills])
+        for name, skills in groups.items()
+    }
+    top = sorted(lift, key=lift.get, reverse=True)[:2]
+    stem = f"{height}in_{'_'.join(name.lower() for name in top)}"
+    name, suffix = stem, 2
+    while name in taken:
+        name = f"{stem}_{suffix}"
+        suffix += 1
+    taken.add(name)
+    return name
+
+
+def centroid_to_csv(template_data, centroid, step_costs, valid):
+    """
+    Fill the template: each skill row from centroid + 1 to 99 with per-step
+    costs. Values with no weight in the table are left blank.
+    """
+    populated = [row[:] for row in template_data]
+    for row in template_data[1:]:
+        if not row[0]:
+            continue
+        skill = TEMPLATE_ROW_ALIASES.get(row[0].lower(), row[0])
+        si = next((i for i, s in enumerate(SKILLS) if s.lower() == skill.lower()), None)
+        if si is None:
+            continue
+        start = int(np.clip(round(float(centroid[si])), MIN_VALUE, MAX_VALUE)) + 1
+        if start > MAX_VALUE:
+            continue
+        values = [f"{v:g}" if ok else '' for v, ok in zip(step_costs[si, start - MIN_VALUE:], valid[si, start - MIN_VALUE:])]
+        populated = populate_csv(populated, values, row[0], start)
+    return populated
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Cluster a build corpus into vc_weights archetype files")
+    parser.add_argument('corpus', help='Path to build CSV or .npz corpus cache')
+    parser.add_argument('-k', type=int, default=4, help='Archetypes per height (default: 4)')
+    parser.add_argument('--overall', type=int, help='Only use builds with this overall rating')
+    parser.add_argument('--heights', type=int, nargs='+', help='Only cluster these heights (inches)')
+    parser.add_argument('--min-builds', type=int, default=50, help='Skip heights with fewer builds (default: 50)')
+    parser.add_argument('--batch-size', type=int, default=4096, help='Mini-batch size (default: 4096)')
+    parser.add_argument('--max-iter', type=int, default=200, help='Mini-batch iterations per height (default: 200)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--out-dir', default=str(OUTPUT_DIR), help='Output directory (default: src/resources/discovered_archetypes)')
+    args = parser.parse_args(argv)
+
+    print(f"Loading builds from {args.corpus}...")
+    corpus = weight_arrays.load_corpus(args.corpus, overall=args.overall)
+    print(f"Loaded {len(corpus['height'])} builds")
+
+    table = weight_arrays.load_cost_table()
+    template_data = load_template(TEMPLATE_FILE)
+    groups = build_rules.load_skill_groups()
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    heights = args.heights or [int(h) for h in np.unique(corpus['height'])]
+    catalog = []
+    taken = set()
+    for height in heights:
+        at_height = corpus['height'] == height
+        n = int(at_height.sum())
+        if n < args.min_builds:
+            print(f"\nSkipping {height}\": only {n} builds")
+            continue
+        row = weight_arrays.lookup_heights(table, [height], nearest=True)[0]
+
+        skills = corpus['skills'][at_height]
+        centers, sizes = minibatch_kmeans(skills, args.k, args.batch_size, args.max_iter, seed=args.seed)
+        mean = skills.mean(axis=0)
+
+        print(f"\n{format_height(height)} ({n} builds):")
+        empty = int((sizes == 0).sum())
+        if empty:
+            print(f"  {empty} of {len(sizes)} clusters are empty (too few distinct builds), not written")
+        for ci in np.argsort(-sizes)[:len(sizes) - empty]:
+            name = archetype_name(centers[ci], height, groups, mean, taken)
+            write_output_csv(centroid_to_csv(template_data, centers[ci], table['step'][row], table['valid'][row]), out_dir / f"{name}.csv")
+            print(f"  {name}: {sizes[ci]} builds ({sizes[ci] / n:.0%})")
+            catalog.append([f"{name}.csv", height, int(sizes[ci])] + [int(round(float(v))) for v in centers[ci]])
+
+    catalog_path = out_dir / 'catalog.csv'
+    with open(catalog_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['file', 'height', 'builds'] + SKILLS)
+        writer.writerows(catalog)
+    print(f"\nWrote {len(catalog)} archetypes, catalog at {catalog_path}")
+
+
+if __name__ == '__main__':
+    main()
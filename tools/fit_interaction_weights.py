@@ -7,20 +7,23 @@ Total cost = base cumulative weight from build_weights.json
            + sum_i (w_i * interaction_i)
 
 We solve a ridge regression to minimize squared error to the target mean cost
-across 99 OVR builds.
+across 99 OVR builds. With --joint-overall every overall level is used: 99 OVR
+keeps the target mean and each other overall gets its own target total, solved
+together with the shared weights.
+
+Usage:
+  python tools/fit_interaction_weights.py builds.csv [--overall 99] [--target-mean 1721]
+  python tools/fit_interaction_weights.py builds.csv --joint-overall
 """
+import argparse
 import json
 import csv
-import re
-import numpy as np
-from pathlib import Path
 
-SKILLS = [
-    'Close Shot', 'Driving Layup', 'Driving Dunk', 'Standing Dunk', 'Post Control',
-    'Mid Range Shot', 'Three Point Shot', 'Free Throw', 'Pass Accuracy', 'Ball Handle',
-    'Speed With Ball', 'Interior Defense', 'Perimeter Defense', 'Steal', 'Block',
-    'Offensive Rebound', 'Defensive Rebound', 'Speed', 'Agility', 'Strength', 'Vertical'
-]
+import weight_arrays
+from skill_schema import SKILLS, parse_height
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
 
 # Generate all unique interaction pairs (i < j)
 INTERACTIONS = [(SKILLS[i], SKILLS[j]) for i in range(len(SKILLS)) for j in range(i + 1, len(SKILLS))]
@@ -29,16 +32,6 @@ TARGET_MEAN = 1721  # from 99 OVR observed average
 RIDGE_LAMBDA = 1e-2
 
 
-def parse_height(height_str):
-    if isinstance(height_str, int):
-        return height_str
-    height_str = str(height_str).strip()
-    m = re.search(r"(\d+)\s*[^\d]+\s*(\d+)", height_str)
-    if m:
-        return int(m.group(1)) * 12 + int(m.group(2))
-    return None
-
-
 def load_weights(weights_path):
     with open(weights_path, 'r') as f:
         return json.load(f)
@@ -54,13 +47,14 @@ def cumulative_cost_for_skill(arr, value):
 
 
 def load_builds(csv_path, overall_filter=99):
+    """Builds from the CSV with the given overall, or every overall if overall_filter is None."""
     builds = []
     with open(csv_path, 'r') as f:
         reader = csv.DictReader(f)
         headers = {h.lower(): h for h in reader.fieldnames}
         for row in reader:
             overall = int(row[headers['overall']])
-            if overall != overall_filter:
+            if overall_filter is not None and overall != overall_filter:
                 continue
             height = parse_height(row[headers['height']])
             if not height:
@@ -83,10 +77,11 @@ def build_matrix(builds, weights_data):
         # base total
         base = 0
         for skill, val in b['skills'].items():
-            arr = hw.get(skill)
-            if arr is None:
+            # Table keys differ in casing ('Speed With Ball'), match like getWeight.js
+            key = weight_arrays.find_skill_key(hw, skill)
+            if key is None:
                 continue
-            base += cumulative_cost_for_skill(arr, val)
+            base += cumulative_cost_for_skill(hw[key], val)
         base_totals.append(base)
         # interaction features
         feats = []
@@ -109,6 +104,35 @@ def fit_interactions(base_totals, X, target_mean=TARGET_MEAN, ridge=RIDGE_LAMBDA
     return w
 
 
+def fit_interactions_joint(base_totals, X, groups, anchor, target_mean=TARGET_MEAN, ridge=RIDGE_LAMBDA):
+    """
+    Shared interaction weights with a target total per group (overall level).
+
+    Group `anchor` keeps target_mean; every other group's target is solved
+    together with w. Minimizes |base + X w - t[groups]|^2 + lambda||w||^2: for
+    fixed w a free target is its group's mean prediction, so those targets drop
+    out by centering base and X within their groups, and X is used once for
+    every group. Without the anchor the interactions could shift every total
+    by the same amount for free. Returns (w, targets), indexed by group code.
+    """
+    counts = np.bincount(groups).astype(float)
+
+    def group_mean(values):
+        sums = np.zeros((len(counts),) + values.shape[1:])
+        np.add.at(sums, groups, values)
+        return sums / counts.reshape((-1,) + (1,) * (values.ndim - 1))
+
+    free = (groups != anchor)[:, None]
+    Xc = X - free * group_mean(X)[groups]
+    r = np.where(free[:, 0], base_totals - group_mean(base_totals)[groups], base_totals - target_mean)
+    XtX = Xc.T @ Xc
+    XtX += ridge * np.eye(XtX.shape[0])
+    w = np.linalg.solve(XtX, -Xc.T @ r)
+    targets = group_mean(base_totals + X @ w)
+    targets[anchor] = target_mean
+    return w, targets
+
+
 def evaluate(base_totals, X, w):
     preds = base_totals + X @ w
     return {
@@ -119,20 +143,48 @@ def evaluate(base_totals, X, w):
     }
 
 
-def main():
-    csv_path = '/Users/ethanco/Downloads/2kbuilds-68.csv'
-    weights_path = Path(__file__).parent.parent / 'src' / 'data' / 'build_weights.json'
-
-    print(f"Loading weights from {weights_path}...")
-    weights_data = load_weights(weights_path)
-    print("Loading 99 OVR builds...")
-    builds = load_builds(csv_path, overall_filter=99)
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Fit pairwise skill interaction weights on top of build_weights.json")
+    parser.add_argument('csv_file', help='Path to CSV file with builds')
+    parser.add_argument('--overall', type=int, default=99,
+                        help='Only use builds with this overall rating; with --joint-overall, the overall held at --target-mean (default: 99)')
+    parser.add_argument('--joint-overall', action='store_true',
+                        help='Use every overall level, solving a target total per overall together with the weights')
+    parser.add_argument('--weights', default=str(weight_arrays.WEIGHTS_FILE), help='Weight table (default: src/data/build_weights.json)')
+    parser.add_argument('--target-mean', type=float, default=TARGET_MEAN, help=f'Target total cost (default: {TARGET_MEAN})')
+    parser.add_argument('--ridge', type=float, default=RIDGE_LAMBDA, help=f'Ridge penalty (default: {RIDGE_LAMBDA:g})')
+    args = parser.parse_args(argv)
+
+    print(f"Loading weights from {args.weights}...")
+    weights_data = load_weights(args.weights)
+    if args.joint_overall:
+        print("Loading builds at every overall...")
+        builds = load_builds(args.csv_file, overall_filter=None)
+        # build_matrix drops heights missing from the table; keep overalls aligned
+        builds = [b for b in builds if str(b['height']) in weights_data]
+    else:
+        print(f"Loading {args.overall} OVR builds...")
+        builds = load_builds(args.csv_file, overall_filter=args.overall)
     print(f"Loaded {len(builds)} builds")
+    if not builds:
+        return
 
     base_totals, X = build_matrix(builds, weights_data)
     print(f"Base totals: mean={np.mean(base_totals):.1f}, std={np.std(base_totals):.1f}, min={np.min(base_totals):.1f}, max={np.max(base_totals):.1f}")
 
-    w = fit_interactions(base_totals, X)
+    if args.joint_overall:
+        levels, groups = np.unique([b['overall'] for b in builds], return_inverse=True)
+        if args.overall not in levels:
+            parser.error(f"--joint-overall keeps the {args.overall} OVR target at --target-mean, but no build has that overall")
+        anchor = int(np.searchsorted(levels, args.overall))
+        w, targets = fit_interactions_joint(base_totals, X, groups, anchor, target_mean=args.target_mean, ridge=args.ridge)
+        preds = base_totals + X @ w
+        print(f"\n{'OVR':>4} {'builds':>7} {'target':>8} {'std before':>11} {'std after':>10}")
+        for g, level in enumerate(levels):
+            mask = groups == g
+            print(f"{level:>4} {mask.sum():>7} {targets[g]:>8.1f} {np.std(base_totals[mask]):>11.1f} {np.std(preds[mask]):>10.1f}")
+    else:
+        w = fit_interactions(base_totals, X, target_mean=args.target_mean, ridge=args.ridge)
     stats = evaluate(base_totals, X, w)
 
     paired = list(zip(INTERACTIONS, w))
@@ -142,7 +194,7 @@ def main():
     for name, val in paired_sorted:
         print(f"  {name}: {val:.3f}")
 
-    print("\nTotals after interaction adjustment:")
+    print("\nTotals after interaction adjustment" + (" (all overalls):" if args.joint_overall else ":"))
     print(f"  mean={stats['mean']:.1f}, std={stats['std']:.1f}, min={stats['min']:.1f}, max={stats['max']:.1f}")
 
 if __name__ == '__main__':
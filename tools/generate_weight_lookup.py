@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Precompute the lookup tables the app reads in its getWeight hot path.
+
+getWeight.js used to re-sum a skill's weight array from 25 on every call and
+scan for valid slider values one step at a time. This script turns
+build_weights.json into src/data/build_weights_lookup.json, holding flat
+arrays indexed by (height row, skill, value - 25):
+
+  cumulative  cost of the skill from 25 up to the value (nulls count as 0)
+  next        smallest valid value >= the value, 0 if there is none
+  prev        largest valid value <= the value, 0 if there is none
+
+plus a dense height map from heightMin..heightMax to the closest table row, so
+getWeight, hasBaseWeight, getValidSliderBounds and the nearest-valid-value
+searches in BuildScreen.js are all single array reads.
+
+Runs as part of `npm run build:weights`, after convert-build-weights.js.
+
+Usage:
+  python tools/generate_weight_lookup.py [--weights src/data/build_weights.json] [--out ...]
+"""
+
+import argparse
+import json
+
+import weight_arrays
+from weight_arrays import SKILLS, MIN_VALUE, NUM_VALUES
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+LOOKUP_FILE = weight_arrays.ROOT / 'src' / 'data' / 'build_weights_lookup.json'
+
+# Decimal places kept for cumulative costs; the table's own steps use at most two
+CUMULATIVE_DECIMALS = 6
+
+
+def valid_neighbours(valid):
+    """
+    Next and previous valid slider values for every (height, skill, value).
+
+    valid has shape (H, 21, 75); both results have the same shape and hold the
+    slider value itself (25..99), or 0 where no valid value exists in that
+    direction.
+    """
+    positions = np.arange(NUM_VALUES)
+    # Previous: running maximum of the positions that are valid
+    prev = np.maximum.accumulate(np.where(valid, positions, -1), axis=2)
+    # Next: running minimum from the right
+    nxt = np.minimum.accumulate(np.where(valid, positions, NUM_VALUES)[..., ::-1], axis=2)[..., ::-1]
+    prev = np.where(prev >= 0, prev + MIN_VALUE, 0)
+    nxt = np.where(nxt < NUM_VALUES, nxt + MIN_VALUE, 0)
+    return nxt, prev
+
+
+def build_lookup(weights_data):
+    """Lookup artifact (a JSON-ready dict) for a parsed build_weights.json."""
+    table = weight_arrays.cost_table_from_dict(weights_data)
+    heights = table['heights']
+    for height in heights:
+        missing = [s for s in SKILLS if weight_arrays.find_skill_key(weights_data[str(height)], s) is None]
+        if missing:
+            print(f"⚠ {height}\" has no weights for: {', '.join(missing)}")
+
+    nxt, prev = valid_neighbours(table['valid'])
+    cumulative = np.round(table['cum'], CUMULATIVE_DECIMALS)
+    height_min, height_max = int(heights[0]), int(heights[-1])
+    height_index = table['nearest_index'][height_min:height_max + 1]
+
+    return {
+        'skills': SKILLS,
+        'heights': [int(h) for h in heights],
+        'minValue': MIN_VALUE,
+        'numValues': NUM_VALUES,
+        'heightMin': height_min,
+        'heightMax': height_max,
+        'heightIndex': [int(i) for i in height_index],
+        'cumulative': [float(v) if v % 1 else int(v) for v in cumulative.ravel()],
+        'next': [int(v) for v in nxt.ravel()],
+        'prev': [int(v) for v in prev.ravel()],
+    }
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Generate the app's precomputed weight lookup tables")
+    parser.add_argument('--weights', default=str(weight_arrays.WEIGHTS_FILE), help='Weight table (default: src/data/build_weights.json)')
+    parser.add_argument('--out', default=str(LOOKUP_FILE), help='Output file (default: src/data/build_weights_lookup.json)')
+    args = parser.parse_args(argv)
+
+    with open(args.weights, 'r') as f:
+        weights_data = json.load(f)
+    lookup = build_lookup(weights_data)
+
+    with open(args.out, 'w') as f:
+        json.dump(lookup, f, separators=(',', ':'))
+        f.write('\n')
+    print(f"Wrote lookup tables for {len(lookup['heights'])} heights x {len(SKILLS)} skills to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Deferred imports for the scripts in tools/.
+
+lazy_import('numpy') returns a stand-in module that imports the real one on
+first attribute access. The scripts bind NumPy and SciPy this way, so their
+--help (and the buildsim dispatcher, which imports a script to run it) does
+not pay for either until there is work to do.
+"""
+
+import importlib
+import sys
+import types
+
+
+class _LazyModule(types.ModuleType):
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        # Later lookups hit the instance dict and skip __getattr__
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    """The module if it is already imported, otherwise a stand-in that imports it on first use."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
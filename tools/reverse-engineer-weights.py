@@ -10,50 +10,39 @@ Columns: position, height, weight, wingspan, and all skills
  Offensive Rebound, Defensive Rebound, Speed, Agility, Strength, Vertical)
 
 Output: build_weights.json with estimated individual weights
+
+By default only builds with --overall (99) are used. --joint-overall fits one
+shared table against every overall level at once, solving a separate target
+total per overall alongside the weights. --bootstrap B refits each height on B
+resamples of its builds across a process pool and reports confidence intervals
+per (skill, value) weight. --joint-heights fits every height in one solve, with
+--height-smoothness pulling each height's weights toward its neighbours' so
+heights with few builds borrow strength from adjacent ones.
 """
 
 import json
 import csv
-import re
 import argparse
-import numpy as np
-from scipy.optimize import minimize
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from pathlib import Path
 
-SKILLS = [
-    'Close Shot', 'Driving Layup', 'Driving Dunk', 'Standing Dunk', 'Post Control',
-    'Mid Range Shot', 'Three Point Shot', 'Free Throw', 'Pass Accuracy', 'Ball Handle',
-    'Speed with Ball', 'Interior Defense', 'Perimeter Defense', 'Steal', 'Block',
-    'Offensive Rebound', 'Defensive Rebound', 'Speed', 'Agility', 'Strength', 'Vertical'
-]
+import skill_schema
+from skill_schema import SKILLS, MIN_VALUE, MAX_VALUE, NUM_VALUES
+from lazy_imports import lazy_import
 
-# Optimize across full skill range
-MIN_VALUE = 25
-MAX_VALUE = 99
-NUM_VALUES = 75  # Full range for output (25-99)
+np = lazy_import('numpy')
+sparse = lazy_import('scipy.sparse')
+sparse_linalg = lazy_import('scipy.sparse.linalg')
+optimize = lazy_import('scipy.optimize')
 
 def parse_height(height_str):
     """Parse height string in format X'Y (e.g., "6'8" or "6'8\"") to total inches."""
-    if isinstance(height_str, int):
-        # Already an integer (in inches)
-        return height_str
-    
-    height_str = str(height_str).strip()
-    
-    # Use regex to match: feet (digits), any non-digit separator(s), inches (digits)
-    # This is flexible enough to handle any quote character
-    match = re.match(r"(\d+)\s*[^\d]+\s*(\d+)", height_str)
-    
-    if match:
-        feet = int(match.group(1))
-        inches = int(match.group(2))
-        return feet * 12 + inches
-    
-    # If no pattern matched, try to parse as integer
-    try:
-        return int(height_str)
-    except ValueError:
+    inches = skill_schema.parse_height(height_str)
+    if inches is None:
         raise ValueError(f"Could not parse height: {height_str}. Expected format like 6'8 or 80 (inches)")
+    return inches
 
 def load_build_data_csv(filepath, total_constant=None):
     """Load build data from CSV file. If total_constant is provided, use it for all builds."""
@@ -115,7 +104,9 @@ def load_prior_weights(filepath, height, param_map):
         prior = np.zeros(len(param_map))
         
         for skill in SKILLS:
-            skill_weights = height_weights.get(skill, [])
+            # Table keys differ in casing ('Speed With Ball'), match like getWeight.js
+            key = skill_schema.find_skill_key(height_weights, skill)
+            skill_weights = height_weights[key] if key is not None else []
             for val in range(MIN_VALUE, MAX_VALUE + 1):
                 col_idx = param_map[(skill, val)]
                 # Index into skill_weights array (0-indexed for value 25, etc.)
@@ -242,7 +233,7 @@ def optimize_weights(X, y, param_map, prior=None):
     
     print(f"  Optimizing {n_params} parameters from {len(y)} observations...")
     
-    result = minimize(
+    result = optimize.minimize(
         objective,
         x0,
         args=(X, y, param_map, prior, 0.001, 0.1, 2.0),
@@ -258,6 +249,407 @@ def optimize_weights(X, y, param_map, prior=None):
     
     return result.x
 
+def create_joint_observation_matrix(builds, height):
+    """
+    Create one sparse observation matrix for a height across all overall levels.
+
+    Same columns as create_observation_matrix, built once and shared by every
+    overall group. Returns (X, groups, overall_levels, param_map) where
+    groups[i] indexes overall_levels for build i.
+    """
+    height_builds = [b for b in builds if b['height'] == height and b.get('overall') is not None]
+
+    if not height_builds:
+        return None, None, None, None
+
+    param_map = {}
+    idx = 0
+    for skill in SKILLS:
+        for val in range(MIN_VALUE, MAX_VALUE + 1):
+            param_map[(skill, val)] = idx
+            idx += 1
+
+    values = np.array([[b['skills'][skill] for skill in SKILLS] for b in height_builds])
+    in_range = (values >= MIN_VALUE) & (values <= MAX_VALUE)
+    rows = np.broadcast_to(np.arange(len(height_builds))[:, None], values.shape)[in_range]
+    cols = (np.arange(len(SKILLS))[None, :] * NUM_VALUES + values - MIN_VALUE)[in_range]
+    X = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(height_builds), len(param_map)))
+
+    overall_levels, groups = np.unique([b['overall'] for b in height_builds], return_inverse=True)
+    return X, groups, overall_levels, param_map
+
+def constraint_penalty_and_grad(weights_flat):
+    """
+    Vectorized version of enforce_constraints, returning (penalty, gradient).
+    Uses the same monotonicity and smoothness rules and constants.
+    """
+    MONO_PENALTY = 1e3
+    SMOOTH_ALLOW = 100.0
+    SMOOTH_WEIGHT = 10.0
+
+    W = weights_flat.reshape(len(SKILLS), NUM_VALUES)
+    diffs = W[:, 1:] - W[:, :-1]
+    dec = np.maximum(-diffs, 0.0)
+    excess = np.maximum(np.abs(diffs) - SMOOTH_ALLOW, 0.0)
+    penalty = MONO_PENALTY * np.sum(dec ** 2) + SMOOTH_WEIGHT * np.sum(excess ** 2)
+
+    d_diffs = -2 * MONO_PENALTY * dec + 2 * SMOOTH_WEIGHT * excess * np.sign(diffs)
+    grad = np.zeros_like(W)
+    grad[:, 1:] += d_diffs
+    grad[:, :-1] -= d_diffs
+    return penalty, grad.ravel()
+
+def joint_objective(weights_flat, X, groups, group_counts, prior=None, lambda_reg=0.001, lambda_constraints=0.1, lambda_prior=2.0, sample_weights=None):
+    """
+    Joint objective across overall levels, returning (value, gradient).
+
+    Each overall level gets its own target total; for fixed weights the best
+    target is that group's mean prediction, so the fit term is the pooled
+    within-group variance. With a single overall level this is exactly the
+    variance term of objective().
+
+    sample_weights (e.g. bootstrap multiplicities) weight each build's
+    residual; group_counts must then be the per-group sums of those weights.
+    """
+    predictions = X @ weights_flat
+    if sample_weights is None:
+        targets = np.bincount(groups, weights=predictions) / group_counts
+        residuals = predictions - targets[groups]
+        weighted = residuals
+        n = len(residuals)
+    else:
+        targets = np.bincount(groups, weights=sample_weights * predictions) / np.maximum(group_counts, 1e-12)
+        residuals = predictions - targets[groups]
+        weighted = sample_weights * residuals
+        n = sample_weights.sum()
+
+    value = np.dot(weighted, residuals) / n
+    # Group residuals sum to zero, so the targets drop out of the gradient
+    grad = (2.0 / n) * (X.T @ weighted)
+
+    value += lambda_reg * np.sum(weights_flat ** 2)
+    grad += 2 * lambda_reg * weights_flat
+
+    if prior is not None:
+        value += lambda_prior * np.sum((weights_flat - prior) ** 2)
+        grad += 2 * lambda_prior * (weights_flat - prior)
+
+    penalty, penalty_grad = constraint_penalty_and_grad(weights_flat)
+    value += lambda_constraints * penalty
+    grad += lambda_constraints * penalty_grad
+    return value, grad
+
+def optimize_weights_joint(X, groups, param_map, prior=None):
+    """
+    Fit one weight vector against all overall groups at once.
+    Returns (weights, per-overall target totals).
+    """
+    n_params = len(param_map)
+    x0 = prior.copy() if prior is not None else np.ones(n_params) * 50
+    bounds = [(0, None) for _ in range(n_params)]
+    group_counts = np.bincount(groups).astype(float)
+
+    print(f"  Optimizing {n_params} parameters from {len(groups)} observations across {len(group_counts)} overall levels...")
+
+    result = optimize.minimize(
+        joint_objective,
+        x0,
+        args=(X, groups, group_counts, prior, 0.001, 0.1, 2.0),
+        jac=True,
+        method='L-BFGS-B',
+        bounds=bounds,
+        options={'maxiter': 50000}
+    )
+
+    if result.success:
+        print(f"  ✓ Optimization converged")
+    else:
+        print(f"  ⚠ Optimization did not fully converge: {result.message}")
+
+    targets = np.bincount(groups, weights=X @ result.x) / group_counts
+    return result.x, targets
+
+def cross_height_system(Xs, groups_list, priors, heights, smoothness=1.0, lambda_reg=0.001, lambda_prior=2.0):
+    """
+    Quadratic part of the cross-height objective, kept in factored form.
+
+    Unknowns are every height's weights (height-major, P per height) followed
+    by one target total per (height, overall) group. Each height's fit term
+    is its within-group variance written with explicit targets,
+    (1/n_h) ||X_h w_h - E_h t_h||^2, so the whole fit is B^T diag(2/n) B for
+    the sparse B = [blockdiag(X_h), -E] and is never multiplied out.
+    Adjacent heights are tied by smoothness / gap * ||w_h - w_h'||^2.
+    """
+    n_heights, n_params = len(Xs), Xs[0].shape[1]
+    n_w = n_heights * n_params
+    target_offsets = np.concatenate([[0], np.cumsum([groups.max() + 1 for groups in groups_list])])
+
+    target_cols = np.concatenate([groups + target_offsets[h] for h, groups in enumerate(groups_list)])
+    E = sparse.csr_matrix((np.ones(len(target_cols)), (np.arange(len(target_cols)), target_cols)),
+                          shape=(len(target_cols), target_offsets[-1]))
+    B = sparse.hstack([sparse.block_diag(Xs, format='csr'), -E], format='csr')
+    row_weights = np.concatenate([np.full(len(groups), 2.0 / len(groups)) for groups in groups_list])
+
+    diag = np.zeros(n_w + target_offsets[-1])
+    rhs = np.zeros_like(diag)
+    for h, prior in enumerate(priors):
+        block = slice(h * n_params, (h + 1) * n_params)
+        diag[block] = 2 * lambda_reg
+        if prior is not None:
+            diag[block] += 2 * lambda_prior
+            rhs[block] = 2 * lambda_prior * prior
+
+    # Coupling weight (already doubled) between height rows h and h + 1
+    coupling = 2 * smoothness / np.diff(np.asarray(heights, dtype=float))
+
+    # First differences along slider values, within each (height, skill)
+    D = sparse.kron(sparse.identity(n_heights * len(SKILLS)),
+                    sparse.diags([-np.ones(NUM_VALUES - 1), np.ones(NUM_VALUES - 1)], [0, 1],
+                                 shape=(NUM_VALUES - 1, NUM_VALUES)), format='csr')
+    D.resize((D.shape[0], len(diag)))
+
+    return {
+        'B': B, 'Bt': B.T.tocsr(), 'Dt': D.T.tocsr(), 'row_weights': row_weights, 'diag': diag, 'rhs': rhs, 'coupling': coupling, 'D': D,
+        'n_heights': n_heights, 'n_params': n_params, 'target_offsets': target_offsets,
+        # Diagonals of B^T diag(row_weights) B and D^T D, for the preconditioner
+        'fit_diag': B.multiply(B).T @ row_weights, 'D_squared': D.multiply(D).T.tocsr(),
+    }
+
+def _cross_height_matvec(system, penalty_weights, v):
+    """K v for the cross-height Hessian with the given per-difference penalty weights."""
+    B, D = system['B'], system['D']
+    out = system['Bt'] @ (system['row_weights'] * (B @ v)) + system['diag'] * v + system['Dt'] @ (penalty_weights * (D @ v))
+    n_w = system['n_heights'] * system['n_params']
+    W = v[:n_w].reshape(system['n_heights'], system['n_params'])
+    pulls = system['coupling'][:, None] * (W[1:] - W[:-1])
+    coupled = out[:n_w].reshape(W.shape)
+    coupled[1:] += pulls
+    coupled[:-1] -= pulls
+    return out
+
+def _height_band_preconditioner(system, penalty_weights, free):
+    """
+    Preconditioner that solves, for every (skill, value) parameter, the
+    tridiagonal system across heights formed by the Hessian's diagonal and
+    the height coupling (Thomas algorithm, vectorized over parameters).
+    Targets and fixed variables use their diagonal.
+    """
+    n_heights, n_params = system['n_heights'], system['n_params']
+    n_w = n_heights * n_params
+    full_diag = system['fit_diag'] + system['diag'] + system['D_squared'] @ penalty_weights
+    full_diag[:n_w].reshape(n_heights, n_params)[1:] += system['coupling'][:, None]
+    full_diag[:n_w].reshape(n_heights, n_params)[:-1] += system['coupling'][:, None]
+    full_diag[~free] = 1.0
+
+    d = full_diag[:n_w].reshape(n_heights, n_params)
+    free_w = free[:n_w].reshape(n_heights, n_params)
+    off = -system['coupling'][:, None] * (free_w[1:] & free_w[:-1])
+
+    # Forward elimination once; each apply only substitutes
+    c_prime = np.zeros_like(off)
+    denom = np.empty_like(d)
+    denom[0] = d[0]
+    for h in range(1, n_heights):
+        c_prime[h - 1] = off[h - 1] / denom[h - 1]
+        denom[h] = d[h] - c_prime[h - 1] * off[h - 1]
+    target_diag = full_diag[n_w:]
+
+    def apply(r):
+        out = np.empty(len(r))
+        y = r[:n_w].reshape(n_heights, n_params).astype(float)
+        for h in range(1, n_heights):
+            y[h] -= c_prime[h - 1] * y[h - 1]
+        x = out[:n_w].reshape(n_heights, n_params)
+        x[-1] = y[-1] / denom[-1]
+        for h in range(n_heights - 2, -1, -1):
+            x[h] = (y[h] - off[h] * x[h + 1]) / denom[h]
+        out[n_w:] = r[n_w:] / target_diag
+        return out
+
+    return sparse_linalg.LinearOperator((len(full_diag), len(full_diag)), matvec=apply, dtype=float)
+
+def optimize_weights_cross_height(Xs, groups_list, priors, heights, smoothness=1.0, lambda_reg=0.001,
+                                  lambda_constraints=0.1, lambda_prior=2.0, max_iter=50, tol=1e-10):
+    """
+    Fit every height at once, with adjacent heights' weights tied together.
+
+    The objective is joint_objective summed over heights plus the height
+    coupling of cross_height_system. It is piecewise quadratic, so it is
+    minimized by active-set Newton steps: the monotonicity and smoothness
+    penalties active at the current weights, and the weights held at zero,
+    define one sparse linear system, solved by conjugate gradients with the
+    height-banded preconditioner, until the active sets stop changing.
+
+    Returns (weights of shape (H, P), per-height target totals).
+    """
+    MONO_PENALTY = 1e3
+    SMOOTH_ALLOW = 100.0
+    SMOOTH_WEIGHT = 10.0
+
+    system = cross_height_system(Xs, groups_list, priors, heights, smoothness, lambda_reg, lambda_prior)
+    n_heights, n_params = system['n_heights'], system['n_params']
+    n_w = n_heights * n_params
+    offsets = system['target_offsets']
+    D = system['D']
+
+    x = np.concatenate([p if p is not None else np.full(n_params, 50.0) for p in priors] + [np.zeros(offsets[-1])])
+    for h, (X, groups) in enumerate(zip(Xs, groups_list)):
+        x[n_w + offsets[h]:n_w + offsets[h + 1]] = np.bincount(groups, weights=X @ x[h * n_params:(h + 1) * n_params]) / np.bincount(groups)
+    free = np.ones(len(x), dtype=bool)
+    state = None
+    # Loose solves while the active sets move, then one tight solve once they settle
+    step_tol = max(tol, 1e-6)
+
+    print(f"  Optimizing {n_w} parameters across {n_heights} heights from {len(system['row_weights'])} observations...")
+    for iteration in range(1, max_iter + 1):
+        d = D @ x
+        mono = d < 0
+        smooth = np.abs(d) > SMOOTH_ALLOW
+        new_state = (mono.tobytes(), smooth.tobytes(), free.tobytes())
+        if new_state == state:
+            if step_tol == tol:
+                print(f"  ✓ Active sets settled after {iteration - 1} Newton steps")
+                break
+            step_tol = tol
+        state = new_state
+
+        penalty_weights = 2 * lambda_constraints * (MONO_PENALTY * mono + SMOOTH_WEIGHT * smooth)
+        b = system['rhs'] + system['Dt'] @ (2 * lambda_constraints * SMOOTH_WEIGHT * SMOOTH_ALLOW * np.sign(d) * smooth)
+        operator = sparse_linalg.LinearOperator(
+            (len(x), len(x)), dtype=float,
+            matvec=lambda v: np.where(free, _cross_height_matvec(system, penalty_weights, np.where(free, v, 0.0)), v),
+        )
+        x, info = sparse_linalg.cg(operator, np.where(free, b, 0.0), x0=np.where(free, x, 0.0), rtol=step_tol, maxiter=10 * len(x),
+                     M=_height_band_preconditioner(system, penalty_weights, free))
+        if info:
+            print(f"  ⚠ Conjugate gradients stopped early at Newton step {iteration}")
+
+        # Hold negative weights at zero; release held ones the gradient pushes upward
+        grad = _cross_height_matvec(system, penalty_weights, x) - b
+        free[:n_w] = np.where(free[:n_w], x[:n_w] >= 0, grad[:n_w] < 0)
+        x[:n_w] = np.maximum(x[:n_w], 0.0)
+    else:
+        print(f"  ⚠ Active sets still changing after {max_iter} Newton steps")
+
+    weights = x[:n_w].reshape(n_heights, n_params)
+    targets = [x[n_w + offsets[h]:n_w + offsets[h + 1]] for h in range(n_heights)]
+    return weights, targets
+
+# Per-worker state for bootstrap fits, attached once in _init_bootstrap_worker
+_BOOTSTRAP = {}
+
+def _share_array(arr):
+    """Copy an array into a new shared memory block. Returns (block, spec)."""
+    block = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf)[...] = arr
+    return block, (block.name, arr.shape, arr.dtype.str)
+
+def _attach_array(spec):
+    name, shape, dtype = spec
+    # Workers share the parent's resource tracker, so the parent's unlink
+    # is the only cleanup needed
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+def _init_bootstrap_worker(specs, shape):
+    blocks, arrays = zip(*(_attach_array(spec) for spec in specs))
+    data, indices, indptr, groups, x0, prior = arrays
+    _BOOTSTRAP['blocks'] = blocks
+    _BOOTSTRAP['X'] = sparse.csr_matrix((data, indices, indptr), shape=shape, copy=False)
+    _BOOTSTRAP['groups'] = groups
+    _BOOTSTRAP['x0'] = x0
+    _BOOTSTRAP['prior'] = prior if prior.size else None
+
+def _bootstrap_fit(seed):
+    """Refit on one resample of the builds, drawn with replacement within each overall group."""
+    X, groups = _BOOTSTRAP['X'], _BOOTSTRAP['groups']
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(len(groups))
+    for g in np.unique(groups):
+        members = np.flatnonzero(groups == g)
+        counts += np.bincount(rng.choice(members, size=len(members)), minlength=len(groups))
+    group_counts = np.bincount(groups, weights=counts)
+
+    result = optimize.minimize(
+        joint_objective,
+        _BOOTSTRAP['x0'],
+        args=(X, groups, group_counts, _BOOTSTRAP['prior'], 0.001, 0.1, 2.0, counts),
+        jac=True,
+        method='L-BFGS-B',
+        bounds=[(0, None)] * X.shape[1],
+        options={'maxiter': 50000}
+    )
+    return result.x
+
+def bootstrap_weights(X, groups, weights_flat, prior, n_boot, workers=None, seed=0):
+    """
+    Refit n_boot times on resampled builds across a process pool.
+
+    The observation matrix, groups, starting point and prior live in shared
+    memory; each task only receives a seed and returns its weight vector.
+    Returns an (n_boot, n_params) array.
+    """
+    X = sparse.csr_matrix(X)
+    arrays = [X.data, X.indices, X.indptr, np.asarray(groups, dtype=np.int64),
+              np.asarray(weights_flat, dtype=float), prior if prior is not None else np.empty(0)]
+    blocks, specs = zip(*(_share_array(np.ascontiguousarray(a)) for a in arrays))
+    try:
+        seeds = np.random.SeedSequence(seed).generate_state(n_boot)
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_bootstrap_worker,
+                                 initargs=(specs, X.shape)) as pool:
+            return np.array(list(pool.map(_bootstrap_fit, seeds.tolist())))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def report_bootstrap(samples, weights_flat, param_map, X, wide_ratio=0.5, level=95):
+    """
+    Print and return per-(skill, value) intervals, flagging weights the data
+    does not pin down.
+
+    A weight is flagged wide when its interval is wider than wide_ratio times
+    its estimate (or 1, whichever is larger), and unsupported when no build
+    uses its value: it is then held only by the prior and constraints, so its
+    interval is narrow without meaning anything.
+    """
+    tail = (100 - level) / 2
+    lower, upper = np.percentile(samples, [tail, 100 - tail], axis=0)
+    width = upper - lower
+    wide = width > wide_ratio * np.maximum(np.abs(weights_flat), 1.0)
+    support = np.asarray((X != 0).sum(axis=0)).ravel()
+    unsupported = support == 0
+
+    rows = []
+    for (skill, val), idx in param_map.items():
+        rows.append({
+            'skill': skill, 'value': val, 'estimate': weights_flat[idx],
+            'lower': lower[idx], 'upper': upper[idx], 'builds': int(support[idx]),
+            'wide': bool(wide[idx]), 'unsupported': bool(unsupported[idx]),
+        })
+
+    print(f"\n  Bootstrap ({len(samples)} refits, {level}% intervals):")
+    print(f"    Median interval width: {np.median(width[~unsupported]) if (~unsupported).any() else 0.0:.2f} (supported weights)")
+    print(f"    Not pinned down by data: {int((wide | unsupported).sum())} of {len(width)} weights "
+          f"({int(wide.sum())} wide, {int(unsupported.sum())} with no supporting builds)")
+    worst = sorted((r for r in rows if r['wide']), key=lambda r: r['upper'] - r['lower'], reverse=True)[:10]
+    for r in worst:
+        print(f"      {r['skill']} {r['value']}: {r['estimate']:.1f} [{r['lower']:.1f}, {r['upper']:.1f}] ({r['builds']} builds)")
+
+    # Unsupported values as runs per skill, e.g. "Close Shot: 25-31, 97-99"
+    for skill in SKILLS:
+        values = [r['value'] for r in rows if r['skill'] == skill and r['unsupported']]
+        if not values:
+            continue
+        runs = []
+        for val in values:
+            if runs and val == runs[-1][1] + 1:
+                runs[-1][1] = val
+            else:
+                runs.append([val, val])
+        print(f"      {skill} unsupported: {', '.join(f'{a}' if a == b else f'{a}-{b}' for a, b in runs)}")
+    return rows
+
 def convert_to_output_format(weights_flat, param_map, height, prior_weights_full=None):
     """
     Convert flat weight array to JSON format matching build_weights.json structure.
@@ -267,6 +659,7 @@ def convert_to_output_format(weights_flat, param_map, height, prior_weights_full
     
     for skill in SKILLS:
         skill_weights = []
+        prior_key = skill_schema.find_skill_key(prior_weights_full, skill) if prior_weights_full else None
         
         # Build full 75-element array (indices 0-74 for values 25-99)
         for val in range(25, 100):
@@ -274,8 +667,8 @@ def convert_to_output_format(weights_flat, param_map, height, prior_weights_full
             
             if val < MIN_VALUE or val > MAX_VALUE:
                 # Use prior weight for values outside optimized range
-                if prior_weights_full and skill in prior_weights_full:
-                    prior_value = prior_weights_full[skill][array_idx]
+                if prior_key is not None:
+                    prior_value = prior_weights_full[prior_key][array_idx]
                     skill_weights.append(prior_value)
                 else:
                     skill_weights.append(None)
@@ -319,12 +712,67 @@ def validate_results(X, y, weights_flat):
     
     return mean_error < 5.0  # Success if mean error < 5%
 
-def main():
-    parser = argparse.ArgumentParser(description="Reverse-engineer individual skill weights from build CSV data")
+def load_full_prior(prior_file, height):
+    """Prior weights for one height in build_weights.json shape, or None."""
+    try:
+        with open(prior_file, 'r') as f:
+            return json.load(f).get(str(height), {})
+    except (OSError, ValueError):
+        return None
+
+def fit_heights_jointly(builds, heights, prior_file, smoothness, output_data):
+    """
+    Fit every height in one optimize_weights_cross_height solve and add each
+    height's table to output_data. Returns the heights that had builds.
+    """
+    fitted, Xs, groups_list, levels_list, priors, param_maps = [], [], [], [], [], []
+    for height in heights:
+        X, groups, overall_levels, param_map = create_joint_observation_matrix(builds, height)
+        if X is None:
+            print(f"  No data for height {height}, skipping")
+            continue
+        fitted.append(height)
+        Xs.append(X)
+        groups_list.append(groups)
+        levels_list.append(overall_levels)
+        param_maps.append(param_map)
+        priors.append(load_prior_weights(str(prior_file), height, param_map))
+
+    if not fitted:
+        print("\nNo data for any height, nothing to fit")
+        return fitted
+
+    print(f"\nFitting {len(fitted)} heights jointly (height smoothness {smoothness:g})...")
+    weights, targets = optimize_weights_cross_height(Xs, groups_list, priors, fitted, smoothness=smoothness)
+
+    for h, height in enumerate(fitted):
+        print(f"\nHeight {height}\" ({Xs[h].shape[0]} builds)")
+        for overall, target, count in zip(levels_list[h], targets[h], np.bincount(groups_list[h])):
+            print(f"    overall {overall}: target total {target:,.1f} ({count} builds)")
+        if np.any(np.diff(targets[h]) < 0):
+            print(f"  ⚠ Target totals do not increase with overall")
+        if validate_results(Xs[h], targets[h][groups_list[h]], weights[h]):
+            print(f"  ✓ Validation passed")
+        else:
+            print(f"  ⚠ Validation warning: error > 5%")
+        output_data[str(height)] = convert_to_output_format(weights[h], param_maps[h], height, load_full_prior(prior_file, height))
+    return fitted
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Reverse-engineer individual skill weights from build CSV data")
     parser.add_argument('input_file', help='Path to input CSV file')
     parser.add_argument('--overall', type=int, default=99, help='Filter to only builds with this overall rating (default: 99)')
+    parser.add_argument('--joint-overall', action='store_true', help='Fit one table against all overall levels at once, with a target total per overall (ignores --overall)')
+    parser.add_argument('--joint-heights', action='store_true', help='Fit all heights as one problem, tying adjacent heights together (see --height-smoothness)')
+    parser.add_argument('--height-smoothness', type=float, default=1.0, help='Penalty on weight differences between adjacent heights for --joint-heights, per inch (default: 1.0)')
+    parser.add_argument('--bootstrap', type=int, metavar='B', help='Refit B times on resampled builds per height and report confidence intervals')
+    parser.add_argument('--bootstrap-out', help='Write per-(height, skill, value) bootstrap intervals to this CSV')
+    parser.add_argument('--wide-ratio', type=float, default=0.5, help='Flag intervals wider than this fraction of the estimate (default: 0.5)')
+    parser.add_argument('--workers', type=int, help='Processes for --bootstrap (default: all cores)')
     parser.add_argument('--total-constant', type=float, default=100000.0, help='If all builds share the same total weight, provide that value here (used when CSV lacks a total weight column). Default: 100000')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.joint_heights and args.bootstrap:
+        parser.error('--bootstrap refits heights one at a time and cannot be combined with --joint-heights')
 
     input_file = args.input_file
     output_file = Path(__file__).parent.parent / 'src' / 'data' / 'build_weights_engineered.json'
@@ -336,7 +784,10 @@ def main():
     print(f"Loaded {len(builds)} builds")
     
     # Filter to target overall if specified
-    if args.overall:
+    if args.joint_overall:
+        builds = [b for b in builds if b.get('overall') is not None]
+        print(f"Joint fit over {len(builds)} builds with overall levels {sorted(set(b['overall'] for b in builds))}")
+    elif args.overall:
         builds = [b for b in builds if b.get('overall') == args.overall]
         print(f"Filtered to {len(builds)} builds with overall={args.overall}")
     
@@ -345,32 +796,47 @@ def main():
     print(f"Heights: {heights}")
     
     output_data = {}
-    
-    for height in heights:
+    interval_rows = []
+
+    if args.joint_heights:
+        heights = fit_heights_jointly(builds, heights, prior_file, args.height_smoothness, output_data)
+
+    for height in ([] if args.joint_heights else heights):
         print(f"\nProcessing height {height}\"...")
-        
-        X, y, param_map = create_observation_matrix(builds, height)
+
+        if args.joint_overall:
+            X, groups, overall_levels, param_map = create_joint_observation_matrix(builds, height)
+        else:
+            X, y, param_map = create_observation_matrix(builds, height)
         
         if X is None:
             print(f"  No data for height {height}, skipping")
             continue
         
-        print(f"  {len(y)} builds available")
+        print(f"  {X.shape[0]} builds available")
         
         # Load prior weights if available (for full range)
         prior = load_prior_weights(str(prior_file), height, param_map)
         
         # Also load full prior weights for output (to preserve values outside optimized range)
-        prior_weights_full = None
-        try:
-            with open(prior_file, 'r') as f:
-                prior_data = json.load(f)
-                prior_weights_full = prior_data.get(str(height), {})
-        except:
-            pass
+        prior_weights_full = load_full_prior(prior_file, height)
         
         # Optimize weights
-        weights_flat = optimize_weights(X, y, param_map, prior=prior)
+        if args.joint_overall:
+            weights_flat, targets = optimize_weights_joint(X, groups, param_map, prior=prior)
+            for overall, target, count in zip(overall_levels, targets, np.bincount(groups)):
+                print(f"    overall {overall}: target total {target:,.1f} ({count} builds)")
+            if np.any(np.diff(targets) < 0):
+                print(f"  ⚠ Target totals do not increase with overall")
+            y = targets[groups]
+        else:
+            weights_flat = optimize_weights(X, y, param_map, prior=prior)
+
+        if args.bootstrap:
+            boot_groups = groups if args.joint_overall else np.zeros(X.shape[0], dtype=np.int64)
+            samples = bootstrap_weights(X, boot_groups, weights_flat, prior, args.bootstrap, args.workers)
+            for row in report_bootstrap(samples, weights_flat, param_map, X, args.wide_ratio):
+                interval_rows.append({'height': height, **row})
         
         # Validate
         if validate_results(X, y, weights_flat):
@@ -387,6 +853,13 @@ def main():
     with open(output_file, 'w') as f:
         json.dump(output_data, f, indent=2)
     
+    if args.bootstrap_out and interval_rows:
+        with open(args.bootstrap_out, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(interval_rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(interval_rows)
+        print(f"Saved bootstrap intervals to {args.bootstrap_out}")
+
     print("✓ Done!")
     print(f"\nTo use these weights, replace src/data/build_weights.json with:")
     print(f"  cp {output_file} src/data/build_weights.json")
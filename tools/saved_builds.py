@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Bulk import, export and checking of saved builds in the compact record format.
+
+import   app saved builds (the JSON array buildStorage.js keeps), a scraped
+         build CSV or a .npz corpus -> .bld archive (24 bytes per build)
+export   .bld archive -> JSON array in the app's saved-build shape
+check    rescore, revalidate and badge-evaluate every build of an archive (or
+         any input accepted by import) in one vectorized pass
+
+Usage:
+  python tools/saved_builds.py import saved-builds.json --out builds.bld
+  python tools/saved_builds.py export builds.bld --out saved-builds.json
+  python tools/saved_builds.py check builds.bld [--out report.csv]
+"""
+
+import argparse
+import csv
+import json
+from pathlib import Path
+
+import build_rules
+import weight_arrays
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+# build_records builds its record dtype at import time
+build_records = lazy_import('build_records')
+
+MAX_WINGSPAN_OVER_HEIGHT = 6
+MIN_WEIGHT = 120
+MAX_WEIGHT = 360
+
+
+def load_builds(path, overall=None):
+    """Read an archive, app JSON or corpus file into (records, metadata)."""
+    path = Path(path)
+    if path.suffix == '.bld':
+        return build_records.read_archive(path)
+    if path.suffix == '.json':
+        with open(path, 'r') as f:
+            saved = json.load(f)
+        if isinstance(saved, dict):
+            saved = saved.get('builds', [])
+        return build_records.builds_from_saved(saved)
+
+    corpus = weight_arrays.load_corpus(path, overall=overall)
+    heights = corpus['height'].astype(np.int64)
+    # Scraped corpora often omit wingspan and weight; fill in the app's defaults
+    wingspans = np.where(corpus['wingspan'] > 0, corpus['wingspan'], heights + build_records.DEFAULT_WINGSPAN_OVER_HEIGHT)
+    weights = np.where(corpus['weight'] > 0, corpus['weight'], build_records.DEFAULT_WEIGHT)
+    return build_records.encode_records(heights, wingspans, weights, corpus['skills']), None
+
+
+def check_builds(records, table, constraints, badges, weight_cap):
+    """
+    Score and validate every record at once.
+
+    Returns a dict of arrays: total, over_cap, invalid_sliders (N, 21),
+    violations (N, C), bad_height, bad_wingspan, bad_weight, valid and badge
+    levels (N, B).
+    """
+    builds = build_records.decode_records(records)
+    heights, skills = builds['height'], builds['skills']
+    totals = weight_arrays.build_totals(table, heights, skills, nearest=True)
+    invalid_sliders = ~weight_arrays.valid_sliders(table, heights, skills)
+    violations = build_rules.constraint_violations(constraints, heights, skills)
+
+    bad_height = (heights < build_rules.MIN_HEIGHT) | (heights > build_rules.MAX_HEIGHT)
+    bad_wingspan = (builds['wingspan'] < heights) | (builds['wingspan'] > heights + MAX_WINGSPAN_OVER_HEIGHT)
+    bad_weight = (builds['weight'] < MIN_WEIGHT) | (builds['weight'] > MAX_WEIGHT)
+    over_cap = totals > weight_cap
+    valid = ~(over_cap | invalid_sliders.any(axis=1) | violations.any(axis=1) | bad_height | bad_wingspan | bad_weight)
+
+    return {
+        'total': totals,
+        'over_cap': over_cap,
+        'invalid_sliders': invalid_sliders,
+        'violations': violations,
+        'bad_height': bad_height,
+        'bad_wingspan': bad_wingspan,
+        'bad_weight': bad_weight,
+        'valid': valid,
+        'badges': build_rules.evaluate_badges(badges, heights, skills),
+    }
+
+
+def print_check_report(result, constraints, badges, weight_cap):
+    n = len(result['total'])
+    print(f"\nChecked {n:,} builds (WEIGHT_CAP = {weight_cap:,.0f}):")
+    print(f"  Valid:                 {int(result['valid'].sum()):,}")
+    print(f"  Over cap:              {int(result['over_cap'].sum()):,}")
+    print(f"  Invalid slider values: {int(result['invalid_sliders'].any(axis=1).sum()):,}")
+    print(f"  Constraint violations: {int(result['violations'].any(axis=1).sum()):,}")
+    print(f"  Height out of range:   {int(result['bad_height'].sum()):,}")
+    print(f"  Wingspan out of range: {int(result['bad_wingspan'].sum()):,}")
+    print(f"  Weight out of range:   {int(result['bad_weight'].sum()):,}")
+    if n:
+        print(f"  Total weight:          mean {np.nanmean(result['total']):,.1f}, max {np.nanmax(result['total']):,.1f}")
+
+    broken = result['violations'].sum(axis=0)
+    if broken.any():
+        print("\nMost violated constraints:")
+        definitions = constraints['definitions']
+        for ci in np.argsort(-broken)[:10]:
+            if broken[ci]:
+                print(f"  {definitions[ci]['primary']} -> {definitions[ci]['dependent']}: {int(broken[ci]):,}")
+
+    unlocked = (result['badges'] > 0).sum(axis=0)
+    if unlocked.any():
+        print("\nMost common badges:")
+        for bi in np.argsort(-unlocked)[:10]:
+            if unlocked[bi]:
+                print(f"  {badges['definitions'][bi]['name']:<28} {int(unlocked[bi]):>8,} ({unlocked[bi] / n:.0%})")
+
+
+def write_check_csv(path, result, badges, metadata=None):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['row', 'name', 'total', 'valid', 'over_cap', 'invalid_sliders', 'violations']
+                        + [badge['id'] for badge in badges['definitions']])
+        invalid = result['invalid_sliders'].sum(axis=1)
+        violations = result['violations'].sum(axis=1)
+        for i in range(len(result['total'])):
+            name = metadata[i].get('name', '') if metadata else ''
+            writer.writerow([i, name, f"{result['total'][i]:.2f}", int(result['valid'][i]),
+                             int(result['over_cap'][i]), int(invalid[i]), int(violations[i])]
+                            + result['badges'][i].tolist())
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Import, export and check saved builds in the compact record format")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    imp = sub.add_parser('import', help='Encode builds into a .bld archive')
+    imp.add_argument('input', help='App saved-builds JSON, build CSV or .npz corpus')
+    imp.add_argument('--out', required=True, help='Archive to write (.bld)')
+    imp.add_argument('--overall', type=int, help='Only import corpus builds with this overall rating')
+
+    exp = sub.add_parser('export', help='Decode a .bld archive into app saved-builds JSON')
+    exp.add_argument('archive', help='Archive written by import')
+    exp.add_argument('--out', required=True, help='JSON file to write')
+
+    chk = sub.add_parser('check', help='Rescore, revalidate and badge-evaluate builds')
+    chk.add_argument('input', help='.bld archive or any input accepted by import')
+    chk.add_argument('--overall', type=int, help='Only check corpus builds with this overall rating')
+    chk.add_argument('--weights', default=str(weight_arrays.WEIGHTS_FILE), help='Weight table (default: src/data/build_weights.json)')
+    chk.add_argument('--cap', type=float, help='Weight cap (default: WEIGHT_CAP from src/config.js)')
+    chk.add_argument('--out', help='Write per-build results to this CSV')
+    args = parser.parse_args(argv)
+
+    if args.command == 'import':
+        records, metadata = load_builds(args.input, overall=args.overall)
+        build_records.write_archive(args.out, records, metadata)
+        print(f"Wrote {len(records):,} builds ({len(records) * records.itemsize:,} bytes of records) to {args.out}")
+        return
+
+    if args.command == 'export':
+        records, metadata = build_records.read_archive(args.archive)
+        with open(args.out, 'w') as f:
+            json.dump(build_records.saved_from_builds(records, metadata), f, indent=2)
+        print(f"Wrote {len(records):,} builds to {args.out}")
+        return
+
+    records, metadata = load_builds(args.input, overall=args.overall)
+    weight_cap = args.cap or weight_arrays.read_weight_cap()
+    table = weight_arrays.load_cost_table(args.weights)
+    constraints = build_rules.compile_constraints(build_rules.load_constraints())
+    badges = build_rules.compile_badges(build_rules.load_badges())
+
+    result = check_builds(records, table, constraints, badges, weight_cap)
+    print_check_report(result, constraints, badges, weight_cap)
+    if args.out:
+        write_check_csv(args.out, result, badges, metadata)
+        print(f"\nWrote per-build results to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Long-lived local service for batch build scoring, validation and badges.
+
+Loads build_weights.json, attributeConstraints.js and badges.js once and
+serves JSON over HTTP, so other tooling does not pay Python startup and a full
+weight-table load for every call. Concurrent requests for the same endpoint are
+coalesced and answered as one NumPy batch. Source files are polled and hot
+reloaded when they change on disk.
+
+Endpoints (POST bodies are {"builds": [...]} or a single build object):
+  GET  /health    table status
+  POST /score     total weight per build and whether it fits WEIGHT_CAP
+  POST /validate  over-cap, invalid slider values and constraint violations
+  POST /badges    unlocked badge levels per build
+
+A build is {"height": 80 or "6'8", "skills": {"Close Shot": 60, ...}}; skills
+may also be a list of 21 values in the standard skill order.
+
+Usage:
+  python tools/scoring_service.py --port 8765
+  curl -d '{"height": 80, "skills": [...]}' localhost:8765/score
+"""
+
+import argparse
+import asyncio
+import json
+import os
+
+import build_rules
+import weight_arrays
+from skill_schema import SKILLS, MIN_VALUE, MAX_VALUE
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+SKILL_LOOKUP = {skill.lower(): i for i, skill in enumerate(SKILLS)}
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class RequestError(Exception):
+    """Raised for malformed request bodies; reported to the client as 400."""
+
+
+def parse_skill_value(i, skill, value):
+    """A slider value as an int from 25 to 99; whole floats (60.0) are accepted."""
+    number = int(value) if isinstance(value, float) and value.is_integer() else value
+    if isinstance(number, bool) or not isinstance(number, int) or not MIN_VALUE <= number <= MAX_VALUE:
+        raise RequestError(f"Build {i} {skill} must be an integer from {MIN_VALUE} to {MAX_VALUE}, got {value!r}")
+    return number
+
+
+def parse_builds(payload, height_range=None):
+    """
+    Turn a request body into (heights, skills) arrays.
+
+    height_range is the (shortest, tallest) height to accept, in inches.
+    """
+    builds = payload.get('builds', [payload]) if isinstance(payload, dict) else payload
+    if not isinstance(builds, list) or not builds:
+        raise RequestError("Expected a build object or {\"builds\": [...]}")
+
+    heights = np.zeros(len(builds), dtype=np.int64)
+    skills = np.zeros((len(builds), len(SKILLS)), dtype=np.int64)
+    for i, build in enumerate(builds):
+        if not isinstance(build, dict) or 'height' not in build or 'skills' not in build:
+            raise RequestError(f"Build {i} needs 'height' and 'skills'")
+        height = weight_arrays.parse_height(build['height'])
+        if not height:
+            raise RequestError(f"Build {i} has an unparseable height: {build['height']!r}")
+        if height_range and not height_range[0] <= height <= height_range[1]:
+            raise RequestError(f"Build {i} height {height}\" is outside {height_range[0]}-{height_range[1]}\"")
+        heights[i] = height
+
+        values = build['skills']
+        if isinstance(values, list):
+            if len(values) != len(SKILLS):
+                raise RequestError(f"Build {i} skills list must have {len(SKILLS)} values")
+            for idx, value in enumerate(values):
+                skills[i, idx] = parse_skill_value(i, SKILLS[idx], value)
+        elif isinstance(values, dict):
+            # Distinct skills, so 'Close Shot' and 'close shot' cannot stand in for a missing one
+            seen = set()
+            for name, value in values.items():
+                idx = SKILL_LOOKUP.get(name.lower())
+                if idx is not None:
+                    skills[i, idx] = parse_skill_value(i, SKILLS[idx], value)
+                    seen.add(idx)
+            if len(seen) != len(SKILLS):
+                raise RequestError(f"Build {i} is missing skills")
+        else:
+            raise RequestError(f"Build {i} skills must be an object or list")
+    return heights, skills
+
+
+class Tables:
+    """Everything the service preloads, plus the file mtimes it was built from."""
+
+    def __init__(self, weights_file, constraints_file, badges_file, config_file):
+        self.files = [weights_file, constraints_file, badges_file, config_file]
+        self.mtimes = [os.stat(path).st_mtime for path in self.files]
+        self.cost_table = weight_arrays.load_cost_table(weights_file)
+        self.constraints = build_rules.compile_constraints(build_rules.load_constraints(constraints_file))
+        self.badges = build_rules.compile_badges(build_rules.load_badges(badges_file))
+        self.weight_cap = weight_arrays.read_weight_cap(config_file)
+
+    def current_mtimes(self):
+        """mtimes of the source files now, or None while one is missing."""
+        try:
+            return [os.stat(path).st_mtime for path in self.files]
+        except FileNotFoundError:
+            # Mid-write replacement; try again on the next poll
+            return None
+
+    def changed(self):
+        mtimes = self.current_mtimes()
+        return mtimes is not None and mtimes != self.mtimes
+
+
+def score_batch(tables, heights, skills):
+    totals = weight_arrays.build_totals(tables.cost_table, heights, skills, nearest=True)
+    return [{'totalWeight': round(float(t), 4), 'fitsCap': bool(t <= tables.weight_cap)} for t in totals]
+
+
+def validate_batch(tables, heights, skills):
+    table = tables.cost_table
+    totals = weight_arrays.build_totals(table, heights, skills, nearest=True)
+    valid_slider = weight_arrays.valid_sliders(table, heights, skills)
+    violations = build_rules.constraint_violations(tables.constraints, heights, skills)
+    definitions = tables.constraints['definitions']
+    max_diff = tables.constraints['max_diff'][np.clip(heights, 0, build_rules.MAX_HEIGHT)]
+
+    results = []
+    for i in range(len(heights)):
+        invalid = [SKILLS[s] for s in np.flatnonzero(~valid_slider[i])]
+        broken = [
+            {'primary': definitions[c]['primary'], 'dependent': definitions[c]['dependent'],
+             'maxDifference': int(max_diff[i, c])}
+            for c in np.flatnonzero(violations[i])
+        ]
+        over_cap = bool(totals[i] > tables.weight_cap)
+        results.append({
+            'valid': not (invalid or broken or over_cap),
+            'totalWeight': round(float(totals[i]), 4),
+            'overCap': over_cap,
+            'invalidSliders': invalid,
+            'violations': broken,
+        })
+    return results
+
+
+def badges_batch(tables, heights, skills):
+    levels = build_rules.evaluate_badges(tables.badges, heights, skills)
+    ids = [badge['id'] for badge in tables.badges['definitions']]
+    return [{'badges': {ids[b]: int(row[b]) for b in np.flatnonzero(row)}} for row in levels]
+
+
+class Coalescer:
+    """
+    Collects concurrent requests for one operation and runs them as one batch.
+
+    The first request to arrive opens a short window; everything queued by the
+    end of it (up to max_rows builds) is concatenated, evaluated once and the
+    results are split back per request.
+    """
+
+    def __init__(self, service, fn, window, max_rows):
+        self.service = service
+        self.fn = fn
+        self.window = window
+        self.max_rows = max_rows
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def submit(self, heights, skills):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((heights, skills, future))
+        return await future
+
+    async def run(self):
+        while True:
+            pending = [await self.queue.get()]
+            rows = len(pending[0][0])
+            deadline = asyncio.get_running_loop().time() + self.window
+            while rows < self.max_rows:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                rows += len(item[0])
+            self.dispatch(pending)
+
+    def dispatch(self, pending):
+        heights = np.concatenate([p[0] for p in pending])
+        skills = np.concatenate([p[1] for p in pending])
+        try:
+            results = self.fn(self.service.tables, heights, skills)
+        except Exception as exc:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self.service.batches += 1
+        offset = 0
+        for h, _, future in pending:
+            if not future.done():
+                future.set_result(results[offset:offset + len(h)])
+            offset += len(h)
+
+
+class ScoringService:
+    def __init__(self, args):
+        self.args = args
+        self.tables = self.load_tables()
+        self.batches = 0
+        self.reloads = 0
+        self.coalescers = {}
+        self.watcher = None
+
+    def load_tables(self):
+        return Tables(self.args.weights, self.args.constraints, self.args.badges, self.args.config)
+
+    async def watch_files(self):
+        while True:
+            await asyncio.sleep(self.args.reload_interval)
+            if not self.tables.changed():
+                continue
+            try:
+                self.tables = self.load_tables()
+                self.reloads += 1
+                print("Reloaded tables after a source file changed")
+            except Exception as exc:
+                # Keep serving the previous tables until the files change again
+                print(f"⚠ Reload failed, keeping previous tables: {exc}")
+                self.tables.mtimes = self.tables.current_mtimes() or self.tables.mtimes
+
+    def health(self):
+        return {
+            'heights': [int(h) for h in self.tables.cost_table['heights']],
+            'weightCap': self.tables.weight_cap,
+            'constraints': len(self.tables.constraints['definitions']),
+            'badges': len(self.tables.badges['definitions']),
+            'batches': self.batches,
+            'reloads': self.reloads,
+        }
+
+    async def handle(self, method, path, body):
+        if path == '/health':
+            return 200, self.health()
+        coalescer = self.coalescers.get(path)
+        if coalescer is None:
+            return 404, {'error': f"Unknown path {path}"}
+        if method != 'POST':
+            return 405, {'error': 'Use POST'}
+        try:
+            table_heights = self.tables.cost_table['heights']
+            heights, skills = parse_builds(json.loads(body or b'null'),
+                                           height_range=(int(table_heights[0]), int(table_heights[-1])))
+        except (RequestError, ValueError, TypeError) as exc:
+            return 400, {'error': str(exc)}
+        return 200, {'results': await coalescer.submit(heights, skills)}
+
+    async def serve_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                try:
+                    status, payload = await self.handle(method, path.split('?', 1)[0], body)
+                except Exception as exc:
+                    status, payload = 500, {'error': str(exc)}
+
+                data = json.dumps(payload).encode()
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def run(self):
+        window = self.args.batch_window / 1000.0
+        for path, fn in (('/score', score_batch), ('/validate', validate_batch), ('/badges', badges_batch)):
+            self.coalescers[path] = Coalescer(self, fn, window, self.args.max_batch)
+            self.coalescers[path].start()
+        self.watcher = asyncio.create_task(self.watch_files())
+
+        server = await asyncio.start_server(self.serve_connection, self.args.host, self.args.port)
+        print(f"Serving on http://{self.args.host}:{self.args.port} "
+              f"({len(self.tables.cost_table['heights'])} heights, {len(self.tables.badges['definitions'])} badges)")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Local batch scoring service for builds")
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--weights', default=str(weight_arrays.WEIGHTS_FILE), help='Weight table (default: src/data/build_weights.json)')
+    parser.add_argument('--constraints', default=str(build_rules.CONSTRAINTS_FILE), help='Attribute constraints (default: src/data/attributeConstraints.js)')
+    parser.add_argument('--badges', default=str(build_rules.BADGES_FILE), help='Badge definitions (default: src/data/badges.js)')
+    parser.add_argument('--config', default=str(weight_arrays.CONFIG_FILE), help='Config holding WEIGHT_CAP (default: src/config.js)')
+    parser.add_argument('--batch-window', type=float, default=2.0, help='Milliseconds to wait for more requests before running a batch (default: 2)')
+    parser.add_argument('--max-batch', type=int, default=65536, help='Maximum builds per coalesced batch (default: 65536)')
+    parser.add_argument('--reload-interval', type=float, default=1.0, help='Seconds between checks for changed source files (default: 1)')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(ScoringService(args).run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
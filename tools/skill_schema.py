@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Canonical skill schema shared by every script in tools/.
+
+Standard library only, so importing it costs nothing: the unified CLI
+(tools/buildsim) reads it for --help and light subcommands without loading
+NumPy. Skill names follow the scraped CSV headers ('Speed with Ball'); the
+weight table keys differ in casing, so match names with canonical_skill or
+find_skill_key rather than by equality.
+"""
+
+import re
+from numbers import Integral
+
+SKILLS = [
+    'Close Shot', 'Driving Layup', 'Driving Dunk', 'Standing Dunk', 'Post Control',
+    'Mid Range Shot', 'Three Point Shot', 'Free Throw', 'Pass Accuracy', 'Ball Handle',
+    'Speed with Ball', 'Interior Defense', 'Perimeter Defense', 'Steal', 'Block',
+    'Offensive Rebound', 'Defensive Rebound', 'Speed', 'Agility', 'Strength', 'Vertical'
+]
+
+MIN_VALUE = 25
+MAX_VALUE = 99
+NUM_VALUES = MAX_VALUE - MIN_VALUE + 1
+
+SKILL_INDEX = {skill.lower(): i for i, skill in enumerate(SKILLS)}
+
+
+def skill_index(name):
+    """Position of a skill in SKILLS, matched case-insensitively, or None."""
+    return SKILL_INDEX.get(str(name).strip().lower())
+
+
+def canonical_skill(name):
+    """The SKILLS spelling of a skill name in any casing, or None."""
+    idx = skill_index(name)
+    return None if idx is None else SKILLS[idx]
+
+
+def find_skill_key(height_weights, skill):
+    """Case-insensitive skill lookup, mirroring findSkillEntry in getWeight.js."""
+    if skill in height_weights:
+        return skill
+    lower = skill.lower()
+    for key in height_weights:
+        if key.lower() == lower:
+            return key
+    return None
+
+
+def parse_height(height_str):
+    """
+    Parse height string in format X'Y (or plain inches) to total inches, or None.
+
+    Numbers are inches; floats must be whole (80.0) and booleans are rejected.
+    """
+    if isinstance(height_str, bool):
+        return None
+    if isinstance(height_str, Integral):
+        return int(height_str)
+    if isinstance(height_str, float):
+        return int(height_str) if height_str.is_integer() else None
+
+    height_str = str(height_str).strip()
+    # "80" or "80.0" is inches, not 80 feet 0 inches
+    match = re.fullmatch(r"(\d+)(?:\.0*)?", height_str)
+    if match:
+        return int(match.group(1))
+    match = re.match(r"(\d+)\s*[^\d]+\s*(\d+)", height_str)
+    if match:
+        return int(match.group(1)) * 12 + int(match.group(2))
+    try:
+        return int(height_str)
+    except ValueError:
+        return None
+
+
+def format_height(height):
+    """Inches as X'Y\" (80 -> 6'8\"), the inverse of parse_height."""
+    return f"{height // 12}'{height % 12}\""
@@ -0,0 +1,8 @@
+"""Put tools/ on sys.path so tests import the scripts the way they import each other."""
+
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
@@ -0,0 +1,85 @@
+"""Encoding, decoding and archive round-trips for build_records."""
+
+import numpy as np
+import pytest
+
+import build_records
+from skill_schema import SKILLS
+
+
+def random_builds(n, seed=0):
+    rng = np.random.default_rng(seed)
+    heights = rng.integers(69, 89, size=n)
+    return {
+        'height': heights,
+        'wingspan': heights + rng.integers(0, 7, size=n),
+        'weight': rng.integers(120, 361, size=n),
+        'skills': rng.integers(25, 100, size=(n, len(SKILLS))),
+    }
+
+
+def test_encode_decode_round_trip():
+    builds = random_builds(1000)
+    records = build_records.encode_records(builds['height'], builds['wingspan'], builds['weight'], builds['skills'])
+    assert records.dtype.itemsize == 24
+    decoded = build_records.decode_records(records)
+    for field, values in builds.items():
+        np.testing.assert_array_equal(decoded[field], values)
+
+
+def test_encode_rejects_values_that_do_not_fit():
+    builds = random_builds(3)
+    builds['weight'][2] = 100
+    with pytest.raises(ValueError, match='Build 2 has weight 100'):
+        build_records.encode_records(builds['height'], builds['wingspan'], builds['weight'], builds['skills'])
+
+
+def test_archive_round_trip(tmp_path):
+    builds = random_builds(50)
+    records = build_records.encode_records(builds['height'], builds['wingspan'], builds['weight'], builds['skills'])
+    metadata = [{'id': str(i), 'name': f'Build {i}'} for i in range(50)]
+    path = tmp_path / 'builds.bld'
+
+    build_records.write_archive(path, records, metadata)
+    read, read_metadata = build_records.read_archive(path)
+    np.testing.assert_array_equal(read, records)
+    assert read_metadata == metadata
+
+    build_records.write_archive(path, records)
+    assert build_records.read_archive(path)[1] is None
+
+
+def test_read_archive_rejects_truncated_files(tmp_path):
+    builds = random_builds(5)
+    records = build_records.encode_records(builds['height'], builds['wingspan'], builds['weight'], builds['skills'])
+    path = tmp_path / 'builds.bld'
+    build_records.write_archive(path, records)
+    path.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(ValueError, match='truncated'):
+        build_records.read_archive(path)
+
+
+def test_saved_builds_round_trip():
+    saved = [
+        {'id': 'a', 'name': 'Stretch big', 'heightInches': 84, 'wingspan': 88, 'weight': 250,
+         'values': {skill: 25 + i for i, skill in enumerate(SKILLS)}},
+        {'id': 'b', 'heightInches': 75, 'wingspan': 79, 'weight': 190,
+         'values': {skill: 99 - i for i, skill in enumerate(SKILLS)}},
+    ]
+    records, metadata = build_records.builds_from_saved(saved)
+    assert build_records.saved_from_builds(records, metadata) == saved
+
+
+def test_saved_builds_use_app_defaults():
+    records, _ = build_records.builds_from_saved([{'height': "6'8", 'values': {'close shot': 60}}])
+    assert records['wingspan'][0] == 80 + build_records.DEFAULT_WINGSPAN_OVER_HEIGHT
+    assert records['weight'][0] + build_records.WEIGHT_OFFSET == build_records.DEFAULT_WEIGHT
+    assert records['skills'][0, 0] == 60
+    assert (records['skills'][0, 1:] == 25).all()
+
+
+@pytest.mark.parametrize('field, value', [('weight', 'heavy'), ('wingspan', 'long')])
+def test_saved_builds_report_bad_values_by_index(field, value):
+    saved = [{'heightInches': 80}, {'heightInches': 80, field: value}]
+    with pytest.raises(ValueError, match=f"Build 1 has non-numeric {field}"):
+        build_records.builds_from_saved(saved)
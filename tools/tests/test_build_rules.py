@@ -0,0 +1,115 @@
+"""build_rules against the app's own badges.js and attributeConstraints.js, run in Node."""
+
+import json
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+import build_rules
+from skill_schema import SKILLS
+
+NODE = shutil.which('node')
+
+RUNNER = """
+import { readFileSync } from 'fs';
+import { evaluateBadges } from './badges.mjs';
+import { ATTRIBUTE_CONSTRAINTS, checkPrimaryConstraints } from './attributeConstraints.mjs';
+
+const builds = JSON.parse(readFileSync(0, 'utf8'));
+const primaries = [...new Set(ATTRIBUTE_CONSTRAINTS.map((c) => c.primary))];
+const out = builds.map(({ height, values }) => ({
+  badges: evaluateBadges(values, height).map((b) => (b.unlockedLevel ? b.unlockedLevel.level : 0)),
+  violations: primaries.flatMap((p) =>
+    Object.keys(checkPrimaryConstraints(p, values[p], values, height).updates).map((d) => `${p}|${d}`)),
+}));
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+def random_builds(n, badges, seed=0):
+    """Random builds with many values on or just below a badge threshold."""
+    rng = np.random.default_rng(seed)
+    thresholds = sorted({t for badge in badges for level in badge['levels'] for _, t in level['requirements']})
+    near = np.array([v for t in thresholds for v in (t - 1, t) if 25 <= v <= 99])
+    heights = rng.integers(build_rules.MIN_HEIGHT, build_rules.MAX_HEIGHT + 1, size=n)
+    skills = np.where(rng.random((n, len(SKILLS))) < 0.5,
+                      rng.choice(near, size=(n, len(SKILLS))),
+                      rng.integers(25, 100, size=(n, len(SKILLS))))
+    return heights, skills
+
+
+def run_app_rules(tmp_path, heights, skills):
+    data_dir = build_rules.BADGES_FILE.parent
+    shutil.copy(data_dir / 'badges.js', tmp_path / 'badges.mjs')
+    shutil.copy(data_dir / 'attributeConstraints.js', tmp_path / 'attributeConstraints.mjs')
+    (tmp_path / 'runner.mjs').write_text(RUNNER)
+    builds = [{'height': int(h), 'values': dict(zip(SKILLS, map(int, row)))} for h, row in zip(heights, skills)]
+    result = subprocess.run([NODE, 'runner.mjs'], cwd=tmp_path, input=json.dumps(builds),
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+@pytest.mark.skipif(NODE is None, reason='needs node to run the app rules')
+def test_badges_and_constraints_match_the_app(tmp_path):
+    badges = build_rules.load_badges()
+    constraints = build_rules.load_constraints()
+    heights, skills = random_builds(2000, badges)
+    app = run_app_rules(tmp_path, heights, skills)
+
+    levels = build_rules.evaluate_badges(build_rules.compile_badges(badges), heights, skills)
+    np.testing.assert_array_equal(levels, [build['badges'] for build in app])
+
+    violations = build_rules.constraint_violations(build_rules.compile_constraints(constraints), heights, skills)
+    for n, build in enumerate(app):
+        pairs = {f"{c['primary']}|{c['dependent']}" for ci, c in enumerate(constraints) if violations[n, ci]}
+        assert pairs == set(build['violations']), f"build {n} at height {heights[n]}"
+
+
+def test_deadeye_levels_and_height_window():
+    badges = build_rules.load_badges()
+    compiled = build_rules.compile_badges(badges)
+    deadeye = next(bi for bi, badge in enumerate(badges) if badge['id'] == 'deadeye')
+    mini = next(bi for bi, badge in enumerate(badges) if badge['id'] == 'mini_marksman')
+
+    skills = np.full((3, len(SKILLS)), 25)
+    # Deadeye is 'or' over Mid Range and Three Point: Silver at 85, Gold at 92
+    skills[0, SKILLS.index('Mid Range Shot')] = 85
+    skills[1, SKILLS.index('Three Point Shot')] = 92
+    skills[2, SKILLS.index('Three Point Shot')] = 92
+    levels = build_rules.evaluate_badges(compiled, [80, 80, 76], skills)
+    assert list(levels[:, deadeye]) == [2, 3, 3]
+    # Mini Marksman stops at 6'3"
+    assert levels[2, mini] == 0
+
+
+def test_fallback_badges_match_level_by_level_evaluation():
+    # Thresholds that fall with the level cannot be tabulated and take the fallback path
+    badges = [
+        {'id': 'falling', 'minHeight': 69, 'maxHeight': 88, 'levels': [
+            {'level': 1, 'requirements': [('Steal', 60), ('Block', 70)], 'logic': 'and'},
+            {'level': 2, 'requirements': [('Steal', 80), ('Block', 50)], 'logic': 'and'},
+        ]},
+        {'id': 'rising', 'minHeight': 80, 'maxHeight': 88, 'levels': [
+            {'level': 1, 'requirements': [('Speed', 60), ('Agility', 60)], 'logic': 'or'},
+            {'level': 2, 'requirements': [('Speed', 75), ('Agility', 80)], 'logic': 'or'},
+        ]},
+    ]
+    compiled = build_rules.compile_badges(badges)
+    assert compiled['fallback'] == [0]
+
+    rng = np.random.default_rng(2)
+    heights = rng.integers(69, 89, size=500)
+    skills = rng.integers(25, 100, size=(500, len(SKILLS)))
+    levels = build_rules.evaluate_badges(compiled, heights, skills)
+    for bi, badge in enumerate(badges):
+        expected = np.zeros(len(heights), dtype=np.uint8)
+        for n, (height, row) in enumerate(zip(heights, skills)):
+            if not badge['minHeight'] <= height <= badge['maxHeight']:
+                continue
+            for level in badge['levels']:
+                met = [row[SKILLS.index(skill)] >= t for skill, t in level['requirements']]
+                if (any(met) if level['logic'] == 'or' else all(met)):
+                    expected[n] = level['level']
+        np.testing.assert_array_equal(levels[:, bi], expected)
@@ -0,0 +1,56 @@
+"""The cross-height solver in reverse-engineer-weights against per-height L-BFGS fits."""
+
+import numpy as np
+import pytest
+
+from buildsim import load_tool
+from skill_schema import SKILLS
+
+HEIGHTS = [79, 80, 81]
+
+
+@pytest.fixture(scope='module')
+def fit():
+    return load_tool('reverse-engineer-weights')
+
+
+@pytest.fixture(scope='module')
+def problem(fit):
+    """Three heights of random builds at two overalls, with a rising prior."""
+    rng = np.random.default_rng(0)
+    prior = np.cumsum(rng.uniform(0, 3, size=(len(SKILLS), 75)), axis=1).ravel()
+    builds = [
+        {'height': height, 'overall': int(rng.choice([95, 99])),
+         'skills': dict(zip(SKILLS, map(int, rng.integers(40, 99, size=len(SKILLS)))))}
+        for height in HEIGHTS for _ in range(150)
+    ]
+    Xs, groups_list, param_map = [], [], None
+    for height in HEIGHTS:
+        X, groups, _, param_map = fit.create_joint_observation_matrix(builds, height)
+        Xs.append(X)
+        groups_list.append(groups)
+    return Xs, groups_list, [prior.copy() for _ in HEIGHTS], param_map
+
+
+def test_zero_smoothness_matches_per_height_fits(fit, problem):
+    Xs, groups_list, priors, param_map = problem
+    weights, targets = fit.optimize_weights_cross_height(Xs, groups_list, priors, HEIGHTS, smoothness=0.0)
+    assert weights.shape == (len(HEIGHTS), len(param_map))
+    assert (weights >= 0).all()
+
+    for h in range(len(HEIGHTS)):
+        alone, alone_targets = fit.optimize_weights_joint(Xs[h], groups_list[h], param_map, prior=priors[h])
+        counts = np.bincount(groups_list[h]).astype(float)
+        joint_value = fit.joint_objective(weights[h], Xs[h], groups_list[h], counts, priors[h])[0]
+        alone_value = fit.joint_objective(alone, Xs[h], groups_list[h], counts, priors[h])[0]
+        # At least as good as L-BFGS-B, and the same weights up to its tolerance
+        assert joint_value <= alone_value * (1 + 1e-7)
+        np.testing.assert_allclose(weights[h], alone, atol=0.05)
+        np.testing.assert_allclose(targets[h], alone_targets, rtol=1e-4)
+
+
+def test_smoothness_pulls_adjacent_heights_together(fit, problem):
+    Xs, groups_list, priors, _ = problem
+    loose, _ = fit.optimize_weights_cross_height(Xs, groups_list, priors, HEIGHTS, smoothness=0.0)
+    tight, _ = fit.optimize_weights_cross_height(Xs, groups_list, priors, HEIGHTS, smoothness=5.0)
+    assert np.abs(np.diff(tight, axis=0)).mean() < 0.5 * np.abs(np.diff(loose, axis=0)).mean()
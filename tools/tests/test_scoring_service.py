@@ -0,0 +1,69 @@
+"""Request validation in scoring_service.parse_builds."""
+
+import pytest
+
+import scoring_service
+from scoring_service import RequestError, parse_builds
+from skill_schema import SKILLS
+
+HEIGHT_RANGE = (69, 88)
+
+
+def build(height="6'8", **overrides):
+    skills = {skill: 60 for skill in SKILLS}
+    skills.update(overrides)
+    return {'height': height, 'skills': skills}
+
+
+def test_accepts_objects_lists_and_any_skill_casing():
+    lower = {'height': 80, 'skills': {skill.lower(): 70 for skill in SKILLS}}
+    as_list = {'height': '80', 'skills': [float(v) for v in range(40, 40 + len(SKILLS))]}
+    heights, skills = parse_builds({'builds': [build(), lower, as_list]}, HEIGHT_RANGE)
+    assert list(heights) == [80, 80, 80]
+    assert (skills[0] == 60).all() and (skills[1] == 70).all()
+    assert list(skills[2]) == list(range(40, 40 + len(SKILLS)))
+
+
+def test_single_build_body():
+    heights, skills = parse_builds(build("7'0"), HEIGHT_RANGE)
+    assert list(heights) == [84] and skills.shape == (1, len(SKILLS))
+
+
+@pytest.mark.parametrize('value', [24, 100, 60.5, '60', True, None])
+def test_rejects_bad_skill_values(value):
+    with pytest.raises(RequestError, match='Close Shot must be an integer from 25 to 99'):
+        parse_builds([build(**{'Close Shot': value})], HEIGHT_RANGE)
+
+
+@pytest.mark.parametrize('height, message', [
+    ('tall', 'unparseable height'),
+    ("5'0", 'outside 69-88'),
+    (90, 'outside 69-88'),
+])
+def test_rejects_bad_heights(height, message):
+    with pytest.raises(RequestError, match=message):
+        parse_builds([build(), build(height)], HEIGHT_RANGE)
+
+
+def test_duplicate_casing_does_not_stand_in_for_a_missing_skill():
+    skills = {skill: 60 for skill in SKILLS[:-1]}
+    skills['close shot'] = 60
+    with pytest.raises(RequestError, match='Build 0 is missing skills'):
+        parse_builds([{'height': 80, 'skills': skills}], HEIGHT_RANGE)
+
+
+@pytest.mark.parametrize('payload', [[], {'builds': []}, 'build', [{'height': 80}], [{'height': 80, 'skills': 60}]])
+def test_rejects_malformed_bodies(payload):
+    with pytest.raises(RequestError):
+        parse_builds(payload, HEIGHT_RANGE)
+
+
+def test_wrong_length_skill_list():
+    with pytest.raises(RequestError, match=f'must have {len(SKILLS)} values'):
+        parse_builds([{'height': 80, 'skills': [60] * 20}], HEIGHT_RANGE)
+
+
+def test_height_range_is_optional():
+    heights, _ = parse_builds([build(60)])
+    assert list(heights) == [60]
+    assert scoring_service.parse_skill_value(0, 'Steal', 99.0) == 99
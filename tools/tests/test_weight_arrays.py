@@ -0,0 +1,60 @@
+"""Vectorized scoring in weight_arrays against the per-build reference code."""
+
+import json
+
+import numpy as np
+import pytest
+
+import weight_arrays
+from buildsim import load_tool
+from skill_schema import SKILLS, MIN_VALUE, MAX_VALUE
+
+
+def load_weights_data():
+    with open(weight_arrays.WEIGHTS_FILE, 'r') as f:
+        return json.load(f)
+
+
+def test_build_totals_match_calculate_build_weight():
+    calculate = load_tool('calculate-total-weights')
+    weights_data = load_weights_data()
+    table = weight_arrays.cost_table_from_dict(weights_data)
+    rng = np.random.default_rng(0)
+    heights = rng.choice(table['heights'], size=500)
+    # Include values outside 25-99, which the reference clips the same way
+    skills = rng.integers(10, 110, size=(500, len(SKILLS)))
+
+    totals = weight_arrays.build_totals(table, heights, skills)
+    expected = [
+        calculate.calculate_build_weight({'height': int(h), 'skills': dict(zip(SKILLS, map(int, row)))}, weights_data)
+        for h, row in zip(heights, skills)
+    ]
+    np.testing.assert_allclose(totals, expected, rtol=0, atol=1e-6)
+
+
+def test_unknown_heights_are_nan_unless_nearest():
+    table = weight_arrays.load_cost_table()
+    skills = np.full((2, len(SKILLS)), 60)
+    heights = [int(table['heights'][0]) - 5, int(table['heights'][0])]
+    totals = weight_arrays.build_totals(table, heights, skills)
+    assert np.isnan(totals[0]) and not np.isnan(totals[1])
+    nearest = weight_arrays.build_totals(table, heights, skills, nearest=True)
+    assert nearest[0] == nearest[1]
+
+
+def test_marginal_costs_price_the_next_valid_value():
+    table = weight_arrays.load_cost_table()
+    rng = np.random.default_rng(1)
+    rows = rng.integers(0, len(table['heights']), size=200)
+    skills = rng.integers(MIN_VALUE, MAX_VALUE + 1, size=(200, len(SKILLS)))
+
+    marginal = weight_arrays.marginal_costs(table, table['heights'][rows], skills)
+    for n, row in enumerate(rows):
+        for si, value in enumerate(skills[n]):
+            valid = table['valid'][row, si]
+            above = [v for v in range(value + 1, MAX_VALUE + 1) if valid[v - MIN_VALUE]]
+            if not above:
+                assert np.isnan(marginal[n, si])
+                continue
+            expected = table['step'][row, si, value + 1 - MIN_VALUE:above[0] + 1 - MIN_VALUE].sum()
+            assert marginal[n, si] == pytest.approx(expected)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Dense NumPy views of build_weights.json and of scraped build corpora.
+
+The scripts in tools/ walk the weight table one build and one slider step at a
+time. This module loads the table once into (height, skill, value) arrays with
+cumulative costs precomputed, so a whole corpus can be scored with a single
+gather instead of nested Python loops.
+"""
+
+import csv
+import json
+import re
+from pathlib import Path
+
+from skill_schema import SKILLS, MIN_VALUE, MAX_VALUE, NUM_VALUES, find_skill_key, parse_height
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+ROOT = Path(__file__).parent.parent
+WEIGHTS_FILE = ROOT / 'src' / 'data' / 'build_weights.json'
+CONFIG_FILE = ROOT / 'src' / 'config.js'
+
+
+def read_weight_cap(config_file=CONFIG_FILE):
+    """Read WEIGHT_CAP from src/config.js so the tools follow the app's cap."""
+    with open(config_file, 'r') as f:
+        match = re.search(r"WEIGHT_CAP\s*=\s*([\d.]+)", f.read())
+    if not match:
+        raise ValueError(f"WEIGHT_CAP not found in {config_file}")
+    return float(match.group(1))
+
+
+def load_cost_table(weights_file=WEIGHTS_FILE):
+    """
+    Load a build_weights.json file into dense arrays.
+
+    Returns a dict with:
+      heights:      sorted heights in inches, shape (H,)
+      height_index: dense lookup inches -> row in the table (-1 if missing)
+      nearest_index: dense lookup inches -> closest row, like findClosestHeight
+      step:         per-value weight, nulls as 0, shape (H, 21, 75)
+      valid:        True where the JSON entry is non-null, shape (H, 21, 75)
+      cum:          cumulative cost from 25 up to each value, shape (H, 21, 75)
+    """
+    with open(weights_file, 'r') as f:
+        weights_data = json.load(f)
+    return cost_table_from_dict(weights_data)
+
+
+def cost_table_from_dict(weights_data):
+    """Build the dense table (see load_cost_table) from parsed JSON."""
+    heights = np.array(sorted(int(h) for h in weights_data), dtype=np.int64)
+    step = np.zeros((len(heights), len(SKILLS), NUM_VALUES))
+    valid = np.zeros(step.shape, dtype=bool)
+
+    for hi, height in enumerate(heights):
+        height_weights = weights_data[str(height)]
+        for si, skill in enumerate(SKILLS):
+            key = find_skill_key(height_weights, skill)
+            if key is None:
+                continue
+            arr = height_weights[key][:NUM_VALUES]
+            row = np.array([np.nan if v is None else v for v in arr], dtype=float)
+            valid[hi, si, :len(row)] = ~np.isnan(row)
+            step[hi, si, :len(row)] = np.nan_to_num(row)
+
+    height_index = np.full(int(heights.max()) + 1 if len(heights) else 1, -1, dtype=np.int64)
+    height_index[heights] = np.arange(len(heights))
+    # argmin picks the first (shorter) height on ties, same as getWeight.js
+    nearest_index = np.abs(np.arange(len(height_index))[:, None] - heights[None, :]).argmin(axis=1)
+
+    return {
+        'heights': heights,
+        'height_index': height_index,
+        'nearest_index': nearest_index,
+        'step': step,
+        'valid': valid,
+        'cum': np.cumsum(step, axis=2),
+    }
+
+
+def lookup_heights(table, heights, nearest=False):
+    """
+    Map heights in inches to table rows.
+
+    Unknown heights map to -1, or to the closest height in the table when
+    nearest is set (the app's behaviour).
+    """
+    heights = np.asarray(heights, dtype=np.int64)
+    if nearest:
+        index = table['nearest_index']
+        return index[np.clip(heights, 0, len(index) - 1)]
+    index = table['height_index']
+    in_range = (heights >= 0) & (heights < len(index))
+    rows = np.full(heights.shape, -1, dtype=np.int64)
+    rows[in_range] = index[heights[in_range]]
+    return rows
+
+
+def skill_costs(table, heights, skills, nearest=False):
+    """
+    Cumulative cost of every skill for every build, shape (N, 21).
+
+    Values below 25 cost nothing and values above 99 cost the same as 99,
+    as in calculate_build_weight. Rows whose height is not in the table are
+    NaN unless nearest is set.
+    """
+    rows = lookup_heights(table, heights, nearest)
+    values = np.asarray(skills, dtype=np.int64)
+    cols = np.clip(values, MIN_VALUE, MAX_VALUE) - MIN_VALUE
+    costs = table['cum'][np.maximum(rows, 0)[:, None], np.arange(len(SKILLS))[None, :], cols]
+    costs[values < MIN_VALUE] = 0.0
+    costs[rows < 0] = np.nan
+    return costs
+
+
+def build_totals(table, heights, skills, nearest=False, chunk_size=1 << 18):
+    """
+    Total weight of every build, shape (N,). NaN where the height is unknown.
+
+    Works through the corpus in chunks so the (N, 21) intermediates stay
+    small for multi-million-row corpora.
+    """
+    heights = np.asarray(heights)
+    skills = np.asarray(skills)
+    totals = np.empty(len(heights))
+    for start in range(0, len(heights), chunk_size):
+        stop = start + chunk_size
+        totals[start:stop] = skill_costs(table, heights[start:stop], skills[start:stop], nearest).sum(axis=1)
+    return totals
+
+
+def valid_sliders(table, heights, skills):
+    """
+    True where a skill value is between 25 and 99 and has a base weight at
+    the build's (closest) height, shape (N, 21), like hasBaseWeight in the app.
+    """
+    rows = lookup_heights(table, heights, nearest=True)
+    values = np.asarray(skills, dtype=np.int64)
+    cols = np.clip(values, MIN_VALUE, MAX_VALUE) - MIN_VALUE
+    valid = table['valid'][rows[:, None], np.arange(len(SKILLS))[None, :], cols]
+    return valid & (values >= MIN_VALUE) & (values <= MAX_VALUE)
+
+
+def marginal_costs(table, heights, skills):
+    """
+    Cost of raising each skill to its next valid value, for every build,
+    shape (N, 21).
+
+    That is normally +1; where the next values have no base weight the
+    slider skips to the first one that does, as in the app. Skills with no
+    valid value above them (including 99) and builds with unknown heights
+    are NaN.
+    """
+    rows = np.maximum(lookup_heights(table, heights), 0)
+    values = np.asarray(skills, dtype=np.int64)
+    # First valid position at or after each position, NUM_VALUES if none
+    positions = np.arange(NUM_VALUES)
+    first_valid = np.minimum.accumulate(np.where(table['valid'], positions, NUM_VALUES)[..., ::-1], axis=2)[..., ::-1]
+
+    skill_cols = np.arange(len(SKILLS))[None, :]
+    start = np.clip(values + 1, MIN_VALUE, MAX_VALUE) - MIN_VALUE
+    nxt = first_valid[rows[:, None], skill_cols, start]
+    nxt_cum = table['cum'][rows[:, None], skill_cols, np.minimum(nxt, NUM_VALUES - 1)]
+    cur_cum = skill_costs(table, heights, values)
+    cost = nxt_cum - cur_cum
+    cost[(values >= MAX_VALUE) | (nxt >= NUM_VALUES) | np.isnan(cur_cum)] = np.nan
+    return cost
+
+
+def cap_sweep(totals, caps):
+    """
+    Fraction of builds whose total fits under each cap.
+
+    Sorts the totals once and answers every cap with searchsorted, so the
+    cost is O(N log N + C log N) for C candidate caps.
+    """
+    totals = np.sort(np.asarray(totals, dtype=float)[~np.isnan(totals)])
+    if not len(totals):
+        return np.zeros(len(caps))
+    return np.searchsorted(totals, np.asarray(caps, dtype=float), side='right') / len(totals)
+
+
+def load_corpus_csv(csv_file):
+    """
+    Load a scraped build CSV into arrays.
+
+    Columns are matched case-insensitively; position, overall, weight and
+    wingspan are optional. Rows with an unparseable height or missing skills
+    are skipped.
+    """
+    heights, overalls, weights, wingspans, positions, skill_rows = [], [], [], [], [], []
+
+    with open(csv_file, 'r') as f:
+        reader = csv.DictReader(f)
+        headers = {h.lower().strip(): h for h in reader.fieldnames}
+        skill_cols = [headers.get(skill.lower()) for skill in SKILLS]
+        if any(col is None for col in skill_cols):
+            missing = [s for s, col in zip(SKILLS, skill_cols) if col is None]
+            raise ValueError(f"{csv_file} is missing skill columns: {missing}")
+        height_col = headers['height']
+        overall_col = headers.get('overall') or headers.get('ovr')
+        weight_col = headers.get('weight')
+        wingspan_col = headers.get('wingspan')
+        position_col = headers.get('position')
+
+        for row in reader:
+            height = parse_height(row[height_col])
+            if not height:
+                continue
+            try:
+                skill_rows.append([int(row[col]) for col in skill_cols])
+            except (TypeError, ValueError):
+                continue
+            heights.append(height)
+            overalls.append(int(row[overall_col]) if overall_col and row[overall_col] else -1)
+            weights.append(int(row[weight_col]) if weight_col and row[weight_col] else 0)
+            wingspans.append((parse_height(row[wingspan_col]) or 0) if wingspan_col else 0)
+            positions.append(row[position_col] if position_col else 'Unknown')
+
+    return {
+        'height': np.array(heights, dtype=np.int16),
+        'overall': np.array(overalls, dtype=np.int16),
+        'weight': np.array(weights, dtype=np.int16),
+        'wingspan': np.array(wingspans, dtype=np.int16),
+        'position': np.array(positions, dtype=str),
+        'skills': np.array(skill_rows, dtype=np.uint8).reshape(-1, len(SKILLS)),
+    }
+
+
+def load_corpus(path, overall=None):
+    """
+    Load a corpus from a scraped CSV or from a .npz written by save_corpus.
+
+    If overall is given, only builds with that overall rating are kept.
+    """
+    path = Path(path)
+    if path.suffix == '.npz':
+        with np.load(path) as data:
+            corpus = {key: data[key] for key in data.files}
+    else:
+        corpus = load_corpus_csv(path)
+    if overall is not None:
+        corpus = select_builds(corpus, corpus['overall'] == overall)
+    return corpus
+
+
+def save_corpus(corpus, path):
+    """Cache a corpus as .npz so repeated runs skip CSV parsing."""
+    np.savez(path, **corpus)
+
+
+def select_builds(corpus, mask):
+    """Return the subset of a corpus selected by a boolean mask or index array."""
+    return {key: value[mask] for key, value in corpus.items()}